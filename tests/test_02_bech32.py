@@ -155,6 +155,10 @@ INVALID_ADDRESS_ENC = [
     ("bc", 17, 32),
     ("bc", 1, 1),
     ("bc", 16, 41),
+    ("bc", -1, 20),
+    ("b c", 0, 20),
+    ("", 0, 20),
+    ("a" * 50, 0, 32),
 ]
 
 
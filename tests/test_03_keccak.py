@@ -85,3 +85,29 @@ class TestZPyWallet(unittest.TestCase):
         expect = "230620d710cf3ab835059e1aa170735db17cae74b345765ff02e8d89"
         h = Keccak224(pt).hexdigest()
         assert h == expect
+
+    def test_006_native_keccak256(self):
+        for pt in [b"", bytes.fromhex("cc"), bytes(range(64)), b"\xab" * 200]:
+            assert keccak256(pt) == Keccak256(pt).digest()
+
+    def test_007_checksum_address(self):
+        # Test vectors from EIP-55
+        for expect in [
+            "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+            "0xfB6916095ca1df60bB79Ce92cE3Ea74c37c5d359",
+            "0xdbF03B407c01E7cD3CBea99509d93f8DDDC8C6FB",
+            "0xD1220A0cf47c7B9Be7A2E6BA89F429762e7b9aDb",
+        ]:
+            assert to_checksum_address(expect.lower()) == expect
+            assert is_checksum_address(expect)
+            assert not is_checksum_address(expect.lower())
+        # Too short, too long or not hex at all
+        for address in [
+            "",
+            "0x",
+            "0xab",
+            "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAe",
+            "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed00",
+            "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAeg",
+        ]:
+            assert not is_checksum_address(address)
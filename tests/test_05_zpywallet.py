@@ -8,7 +8,7 @@ import unittest
 from zpywallet import wallet
 from zpywallet.bip38 import Bip38PrivateKey
 from zpywallet.network import BitcoinSegwitMainNet
-from zpywallet.utils.bip32 import HDWallet
+from zpywallet.utils.bip32 import HDWallet, is_hex_string, long_to_hex
 from zpywallet.errors import IncompatibleNetworkException
 from zpywallet.utils.keys import PrivateKey
 
@@ -409,3 +409,63 @@ class TestZPyWallet(unittest.TestCase):
             )
             == "5KN7MzqK5wt2TP1fQCYyHBtDrXdJuXbUzm4A9rKAteGu3Qi5CVR"
         )
+
+    def test_009_get_children(self):
+        """Tests batch child derivation against get_child."""
+        hdw = HDWallet.from_master_seed(
+            binascii.unhexlify("000102030405060708090a0b0c0d0e0f"),
+            network=BitcoinSegwitMainNet,
+        )
+        for is_prime in (False, True):
+            children = hdw.get_children(range(5), is_prime=is_prime)
+            for i, child in enumerate(children):
+                assert child.dump_str_xkey(private=True) == hdw.get_child(
+                    i, is_prime=is_prime
+                ).dump_str_xkey(private=True)
+
+    def test_010_public_derivation(self):
+        """Tests that public derivation matches private derivation."""
+        hdw = HDWallet.from_master_seed(
+            binascii.unhexlify("000102030405060708090a0b0c0d0e0f"),
+            network=BitcoinSegwitMainNet,
+        )
+        public = hdw.public_copy()
+        for i in range(3):
+            assert public.get_child(i).dump_str_xkey(private=False) == hdw.get_child(
+                i
+            ).dump_str_xkey(private=False)
+        for i, child in enumerate(public.get_children(range(3))):
+            assert child.dump_str_xkey(private=False) == hdw.get_child(i).dump_str_xkey(
+                private=False
+            )
+
+    def test_011_is_hex_string(self):
+        """Tests hex string detection."""
+        assert is_hex_string("00ffAB")
+        assert is_hex_string(b"00ffAB")
+        assert not is_hex_string("")
+        assert not is_hex_string("0g")
+        assert not is_hex_string(b"\x01\x02")
+
+    def test_012_load_xkey(self):
+        """Tests that dumped extended keys load back to the same key."""
+        hdw = HDWallet.from_master_seed(
+            binascii.unhexlify("000102030405060708090a0b0c0d0e0f"),
+            network=BitcoinSegwitMainNet,
+        )
+        for key in (hdw, hdw.get_child(0, is_prime=True).get_child(1)):
+            for private in (True, False):
+                xkey = key.dump_str_xkey(private=private)
+                assert (
+                    HDWallet.load_str_xkey(xkey).dump_str_xkey(private=private) == xkey
+                )
+
+    def test_013_long_to_hex(self):
+        """Tests zero-padded hex encoding of integers."""
+        assert long_to_hex(0, 8) == b"00000000"
+        assert long_to_hex(0xABCDEF, 8) == b"00abcdef"
+        assert long_to_hex(0xABC, 5) == b"00abc"
+        with self.assertRaises(OverflowError):
+            long_to_hex(1 << 32, 8)
+        with self.assertRaises(ValueError):
+            HDWallet(chain_code=1 << 256, depth=0, private_exponent=1)
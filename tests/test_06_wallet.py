@@ -8,6 +8,8 @@ import unittest
 from zpywallet.generated import wallet_pb2
 from zpywallet import Wallet
 from zpywallet.network import BitcoinSegwitMainNet
+from zpywallet.utils.bip32 import HDWallet
+from zpywallet.utxo import UTXO
 
 
 class TestWallet(unittest.TestCase):
@@ -93,3 +95,165 @@ class TestWallet(unittest.TestCase):
             utxos.append(utxo)
 
         wallet._to_human_friendly_utxo(utxos, [])
+
+    def test_005_wallet_signing_keys(self):
+        """Test matching UTXOs to the wallet's private keys."""
+        wallet = Wallet(
+            BitcoinSegwitMainNet,
+            "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon cactus",
+            "zpywallet",
+            receive_gap_limit=2,
+        )
+        utxos = [
+            UTXO(None, None, _internal_param_do_not_use={"address": address})
+            for address in wallet.addresses() + ["16QaFeudRUt8NYy2yzjm3BMvG4xBbAsBFM"]
+        ]
+        private_keys = wallet.private_keys("zpywallet")
+        inputs = wallet._to_human_friendly_utxo(utxos, private_keys)
+        self.assertEqual(inputs, utxos[:2])
+        for u in inputs:
+            self.assertEqual(u._private_key().public_key.bech32_address(), u.address())
+            self.assertEqual(u._addresshash(), u._private_key().public_key.hash160())
+
+    def test_006_wallet_round_trip(self):
+        """Test that a deserialized wallet has the same addresses and keys."""
+        wallet = Wallet(
+            BitcoinSegwitMainNet,
+            "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon cactus",
+            "zpywallet",
+            receive_gap_limit=3,
+        )
+        restored = Wallet.deserialize(wallet.serialize(), "zpywallet")
+        self.assertEqual(restored.addresses(), wallet.addresses())
+        self.assertEqual(
+            restored.private_keys("zpywallet"), wallet.private_keys("zpywallet")
+        )
+
+    def test_007_wallet_endpoints(self):
+        """Test that endpoints can be given as dicts or RPCNode messages."""
+        wallet = Wallet(
+            BitcoinSegwitMainNet,
+            "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon cactus",
+            "zpywallet",
+            receive_gap_limit=1,
+            fullnode_endpoints=[
+                {"url": "http://localhost:8332", "user": "user", "password": "pass"}
+            ],
+            esplora_endpoints=[wallet_pb2.RPCNode(url="https://blockstream.info/api")],
+            blockcypher_tokens=["token"],
+        )
+        restored = Wallet.deserialize(wallet.serialize(), "zpywallet")
+        self.assertEqual(
+            [(n.url, n.user, n.password) for n in restored.container.fullnode_endpoints],
+            [("http://localhost:8332", "user", "pass")],
+        )
+        self.assertEqual(
+            [n.url for n in restored.container.esplora_endpoints],
+            ["https://blockstream.info/api"],
+        )
+        self.assertEqual(list(restored.container.blockcypher_tokens), ["token"])
+
+    def test_008_wallet_from_serialized(self):
+        """Test loading a wallet without decrypting it."""
+        wallet = Wallet(
+            BitcoinSegwitMainNet,
+            "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon cactus",
+            "zpywallet",
+            receive_gap_limit=3,
+        )
+        loaded = Wallet.from_serialized(wallet.serialize())
+        self.assertEqual(loaded.addresses(), wallet.addresses())
+        self.assertEqual(
+            loaded.private_keys("zpywallet"), wallet.private_keys("zpywallet")
+        )
+        with self.assertRaises(ValueError):
+            loaded.private_keys("wrongpassword")
+
+    def test_009_wallet_without_secrets(self):
+        """Test creating a wallet without deriving its private keys."""
+        wallet = Wallet(
+            BitcoinSegwitMainNet,
+            "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon cactus",
+            "zpywallet",
+            receive_gap_limit=3,
+        )
+        watch_only = Wallet(
+            BitcoinSegwitMainNet,
+            "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon cactus",
+            "zpywallet",
+            receive_gap_limit=3,
+            include_secrets=False,
+        )
+        self.assertEqual(watch_only.addresses(), wallet.addresses())
+        self.assertEqual(
+            [a.pubkey for a in watch_only.container.addresses],
+            [a.pubkey for a in wallet.container.addresses],
+        )
+        self.assertEqual(
+            watch_only.private_keys("zpywallet"), wallet.private_keys("zpywallet")
+        )
+
+    def test_010_wallet_from_hdwallet(self):
+        """Test creating a wallet from an existing master key."""
+        seed_phrase = "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon cactus"
+        wallet = Wallet(
+            BitcoinSegwitMainNet, seed_phrase, "zpywallet", receive_gap_limit=3
+        )
+        hdwallet = HDWallet.from_mnemonic(seed_phrase, network=BitcoinSegwitMainNet)
+        reused = Wallet(
+            BitcoinSegwitMainNet,
+            None,
+            "zpywallet",
+            receive_gap_limit=3,
+            hdwallet=hdwallet,
+        )
+        self.assertEqual(reused.addresses(), wallet.addresses())
+        self.assertEqual(
+            reused.private_keys("zpywallet"), wallet.private_keys("zpywallet")
+        )
+        with self.assertRaises(ValueError):
+            Wallet(
+                BitcoinSegwitMainNet,
+                "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about",
+                "zpywallet",
+                receive_gap_limit=1,
+                hdwallet=hdwallet,
+            )
+        with self.assertRaises(ValueError):
+            Wallet(
+                BitcoinSegwitMainNet,
+                None,
+                "zpywallet",
+                receive_gap_limit=1,
+                hdwallet=hdwallet.get_child(0),
+            )
+        # The passphrase is not stored, so the wallet could not derive the
+        # same keys again after it is reloaded
+        with self.assertRaises(ValueError):
+            Wallet(
+                BitcoinSegwitMainNet,
+                None,
+                "zpywallet",
+                receive_gap_limit=1,
+                hdwallet=HDWallet.from_mnemonic(
+                    seed_phrase, passphrase="extra", network=BitcoinSegwitMainNet
+                ),
+            )
+
+    def test_011_wallet_random_address(self):
+        """Test picking a random address, including from an empty wallet."""
+        wallet = Wallet(
+            BitcoinSegwitMainNet,
+            "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon cactus",
+            "zpywallet",
+            receive_gap_limit=3,
+        )
+        self.assertIn(wallet.random_address(), wallet.addresses())
+        empty = Wallet(
+            BitcoinSegwitMainNet,
+            "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon cactus",
+            "zpywallet",
+            receive_gap_limit=0,
+        )
+        with self.assertRaises(ValueError):
+            empty.random_address()
@@ -19,6 +19,7 @@ from zpywallet.transactions.encode import (
     create_signatures_legacy,
     create_signatures_segwit,
     create_transaction,
+    create_varint,
 )
 from zpywallet.utils.keys import PrivateKey, PublicKey
 from zpywallet.utxo import UTXO
@@ -439,3 +440,19 @@ class TestAddress(unittest.TestCase):
         print(signed_transaction)
         print(correct_signed_transaction)
         self.assertEqual(signed_transaction, correct_signed_transaction)
+
+    def test_008_destination_amount(self):
+        d = Destination("16QaFeudRUt8NYy2yzjm3BMvG4xBbAsBFM", 0.29, BitcoinMainNet)
+        assert d.amount() == 0.29
+        assert d.amount(in_standard_units=False) == 29000000
+
+    def test_009_create_varint(self):
+        assert create_varint(0) == b"\x00"
+        assert create_varint(0xFC) == b"\xfc"
+        assert create_varint(0xFD) == b"\xfd\xfd\x00"
+        assert create_varint(0x10000) == b"\xfe\x00\x00\x01\x00"
+        assert create_varint(0x100000000) == b"\xff" + (0x100000000).to_bytes(
+            8, "little"
+        )
+        with self.assertRaises(OverflowError):
+            create_varint(-1)
@@ -14,6 +14,9 @@ from zpywallet.address import (
     BlockstreamClient,
     MempoolSpaceClient,
 )
+from zpywallet.address.blockcypher import convert_to_utc_timestamp
+from zpywallet.address.fullnode import RPCClient
+from zpywallet.address.provider import deduplicate
 from zpywallet.errors import NetworkException
 from .mock.btc import BitcoinMainUnit
 from .mock.server import gen_random_port, spawn_server, exit_server
@@ -289,3 +292,50 @@ class TestAddress(unittest.TestCase):
         finally:
             # This terminates the last server created whether there was an error or not.
             server.terminate()
+
+    def test_003_deduplicate(self):
+        """Test removing duplicate transactions while keeping their order."""
+        a = Transaction(txid="a", height=1)
+        b = Transaction(txid="b", height=2)
+        self.assertEqual(
+            deduplicate([a, b, Transaction(txid="a", height=1), a]), [a, b]
+        )
+        self.assertEqual(deduplicate([3, 1, 3, 2, 1]), [3, 1, 2])
+
+    def test_004_convert_to_utc_timestamp(self):
+        """Test converting timestamps with and without the ISO 8601 fast path."""
+        self.assertEqual(convert_to_utc_timestamp("2024-02-29T12:34:56Z"), 1709210096)
+        self.assertEqual(
+            convert_to_utc_timestamp("2024-02-29T12:34:56", "%Y-%m-%dT%H:%M:%S"),
+            1709210096,
+        )
+        # Other formats go through strptime
+        self.assertEqual(
+            convert_to_utc_timestamp("29/02/2024 12:34:56", "%d/%m/%Y %H:%M:%S"),
+            1709210096,
+        )
+        # Out of range fields are rejected like strptime rejects them
+        for date_string in [
+            "2024-02-30T12:34:56Z",
+            "2023-02-29T12:34:56Z",
+            "2024-13-01T12:34:56Z",
+            "2024-02-29T25:61:61Z",
+            "2024-02-29T+1:34:56Z",
+        ]:
+            with self.assertRaises(ValueError):
+                convert_to_utc_timestamp(date_string)
+
+    def test_005_rpc_default_ports(self):
+        """Test the default RPC port of each coin and chain."""
+        for coin, chain, port in [
+            ("BTC", "main", 8332),
+            ("BTC", "test", 18332),
+            ("LTC", "main", 9332),
+            ("LTC", "test", 19332),
+            ("DOGE", "main", 22555),
+            ("DOGE", "test", 44555),
+            ("DASH", "main", 9998),
+            ("DASH", "test", 19998),
+        ]:
+            client = RPCClient(coin, chain, user="user", password="pass")
+            self.assertEqual(client.rpc_port, port)
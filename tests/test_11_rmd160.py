@@ -2,6 +2,7 @@ import unittest
 import struct
 from zpywallet.utils.ripemd160 import (
     ripemd160,
+    ripemd160_python,
     RMDContext,
     rmd160_transform,
     rmd160_update,
@@ -17,6 +18,10 @@ class TestRIPEMD160(unittest.TestCase):
         digest = ripemd160(CASE_HELLO_WORLD)
         self.assertEqual(digest.hex(), expected_digest.decode())
 
+    def test_ripemd160_python(self):
+        for data in (b"", CASE_HELLO_WORLD, b"\x02" * 33, b"a" * 200):
+            self.assertEqual(ripemd160_python(data), ripemd160(data))
+
     def test_rmd_context(self):
         ctx = RMDContext()
         self.assertEqual(
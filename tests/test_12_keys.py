@@ -1,7 +1,18 @@
 import unittest
 from hashlib import sha256
+from unittest import mock
+
+import coincurve
+
 from zpywallet.network import BitcoinSegwitMainNet
-from zpywallet.utils.keys import PrivateKey, PublicKey, Point
+from zpywallet.utils import keys
+from zpywallet.utils.keys import (
+    PrivateKey,
+    PublicKey,
+    Point,
+    decode_der_signature,
+    encode_der_signature,
+)
 from zpywallet.errors import IncompatibleNetworkException
 
 
@@ -13,6 +24,9 @@ class TestKey(unittest.TestCase):
         self.assertEqual(int(p), 1)
         self.assertEqual(p.to_hex(), "00" * 31 + "01")
         self.assertEqual(bytes(p), b"\x00" * 31 + b"\x01")
+        self.assertEqual(
+            p.get_extended_key(BitcoinSegwitMainNet), b"80" + b"00" * 31 + b"01"
+        )
         self.assertEqual(
             p.to_wif(compressed=False),
             "5HpHagT65TZzG1PH3CSu63k8DbpvD8s5ip4nEB3kEsreAnchuDf",
@@ -97,3 +111,57 @@ class TestKey(unittest.TestCase):
         self.assertTrue(pp.rfc2440_verify(signature))
         r, s, z = p.rsz_sign(message)
         self.assertTrue(pp.rsz_verify(message, r, s, z, pp.base58_address()))
+        digest = sha256(message.encode("utf-8")).digest()
+        self.assertTrue(pp.digest_verify(digest, p.der_sign(message)))
+        self.assertFalse(pp.digest_verify(digest[::-1], p.der_sign(message)))
+        self.assertFalse(pp.digest_verify(digest[:31], p.der_sign(message)))
+        self.assertFalse(pp.digest_verify(digest + b"\x00", p.der_sign(message)))
+
+    def test_004_der_encoding(self):
+        # High bit set on R requires a leading zero byte, S does not
+        r = 0x80 << 248
+        s = 0x7F
+        der = encode_der_signature(r, s)
+        self.assertEqual(der.hex(), "3026022100" + "80" + "00" * 31 + "02017f")
+        dr, ds = decode_der_signature(der)
+        self.assertEqual(int.from_bytes(dr, "big"), r)
+        self.assertEqual(int.from_bytes(ds, "big"), s)
+        with self.assertRaises(ValueError):
+            decode_der_signature(der[:-1])
+
+    def test_005_public_key_from_address(self):
+        # Only the hash is known, so it must not try to serialize a key
+        pp = PublicKey.from_address(
+            "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4", BitcoinSegwitMainNet
+        )
+        self.assertEqual(pp.hash160().hex(), "751e76e8199196d454941c45d1b3a323f1433bd6")
+
+    def test_006_coincurve_key(self):
+        # The wrapped coincurve key derives its x-only key lazily but must
+        # match a regular coincurve private key.
+        secret = sha256(b"zpywallet").digest()
+        expected = coincurve.PrivateKey(secret)
+        for p in (
+            PrivateKey.from_bytes(secret),
+            PrivateKey.from_int(int(expected.to_int())),
+        ):
+            self.assertEqual(p._key.public_key.format(), expected.public_key.format())
+            self.assertEqual(
+                p._key.public_key_xonly.format(), expected.public_key_xonly.format()
+            )
+            self.assertEqual(p._key.sign(b"message"), expected.sign(b"message"))
+
+    def test_007_coincurve_fallback(self):
+        # Keys are the same when coincurve's internals are not usable and
+        # the plain coincurve private key is used instead.
+        self.assertTrue(keys._coincurve_internals_work())
+        secret = sha256(b"zpywallet").digest()
+        expected = PrivateKey.from_bytes(secret)
+        with mock.patch.object(keys, "_PrivateKeyClass", coincurve.PrivateKey):
+            for p in (
+                PrivateKey.from_bytes(secret),
+                PrivateKey.from_int(int.from_bytes(secret, "big")),
+            ):
+                self.assertIs(type(p._key), coincurve.PrivateKey)
+                self.assertEqual(p.to_hex(), expected.to_hex())
+                self.assertEqual(p.public_key.address(), expected.public_key.address())
@@ -0,0 +1,40 @@
+import base64
+import unittest
+from zpywallet.utils.aes import decrypt_str, encrypt_str, encrypt_str_many
+
+# Encrypted with the original PBKDF2 key derivation
+LEGACY_CIPHERTEXT = b"U2FsdGVkX1+CDtdVpRhE5hK8EoFOrKYG1F7y/0wBkJ0m9+BIWrORl8hbCjPERXRVwyfjQbOqRUpt3ytBbBA5Nw=="
+
+
+class TestAES(unittest.TestCase):
+    def test_001_round_trip(self):
+        enc = encrypt_str("abandon abandon about", "zpywallet")
+        self.assertEqual(decrypt_str(enc, "zpywallet"), "abandon abandon about")
+        with self.assertRaises(ValueError):
+            decrypt_str(enc, "wrongpassword")
+
+    def test_002_encrypt_many(self):
+        raws = ["abandon abandon about", "[]", "zpywallet"]
+        for raw, enc in zip(raws, encrypt_str_many(raws, "zpywallet")):
+            self.assertEqual(decrypt_str(enc, "zpywallet"), raw)
+
+    def test_003_legacy_pbkdf2(self):
+        self.assertEqual(
+            decrypt_str(LEGACY_CIPHERTEXT, "zpywallet"), "abandon abandon about"
+        )
+        with self.assertRaises(ValueError):
+            decrypt_str(LEGACY_CIPHERTEXT, "wrongpassword")
+
+    def test_004_scrypt_parameter_limits(self):
+        ct = base64.b64decode(encrypt_str("abandon abandon about", "zpywallet"))
+        # log2(N), r and p follow the 8 byte marker
+        for params in [(17, 8, 1), (15, 9, 1), (15, 8, 5), (0, 8, 1)]:
+            enc = base64.b64encode(ct[:8] + bytes(params) + ct[11:])
+            with self.assertRaises(ValueError):
+                decrypt_str(enc, "zpywallet")
+
+    def test_005_padding_hides_length(self):
+        # Lengths within the same 16 byte block give ciphertexts of one size
+        encrypted = encrypt_str_many(["a" * n for n in range(16, 32)], "zpywallet")
+        sizes = {len(base64.b64decode(enc)) for enc in encrypted}
+        self.assertEqual(len(sizes), 1)
@@ -1,4 +1,4 @@
-from functools import reduce
+import calendar
 import requests
 import datetime
 
@@ -13,6 +13,40 @@ from ..generated import wallet_pb2
 
 # Note - the input date is assumed to be in UTC, even if you change the format string.
 def convert_to_utc_timestamp(date_string, format_string="%Y-%m-%dT%H:%M:%SZ"):
+    # Fast path for the ISO 8601 timestamps Blockcypher returns: slice out the
+    # fields instead of going through strptime. datetime() range-checks them,
+    # and anything it rejects is left to strptime to report.
+    if (
+        format_string in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%SZ")
+        and len(date_string) == len(format_string) + 2
+        and date_string[4] == "-"
+        and date_string[7] == "-"
+        and date_string[10] == "T"
+        and date_string[13] == ":"
+        and date_string[16] == ":"
+        and date_string[19:] == format_string[17:]
+        and (
+            date_string[0:4]
+            + date_string[5:7]
+            + date_string[8:10]
+            + date_string[11:13]
+            + date_string[14:16]
+            + date_string[17:19]
+        ).isdigit()
+    ):
+        try:
+            return calendar.timegm(
+                datetime.datetime(
+                    int(date_string[0:4]),
+                    int(date_string[5:7]),
+                    int(date_string[8:10]),
+                    int(date_string[11:13]),
+                    int(date_string[14:16]),
+                    int(date_string[17:19]),
+                ).utctimetuple()
+            )
+        except ValueError:
+            pass
     utc_timezone = datetime.timezone.utc
     date_object = datetime.datetime.strptime(date_string, format_string).replace(tzinfo=utc_timezone)
     return int(date_object.timestamp())
@@ -28,6 +62,15 @@ class BlockcypherClient(AddressProvider):
 
     DEFAULT_URL = "https://api.blockcypher.com"
 
+    _COIN_MAP = {
+        "BTC": "btc",
+        "LTC": "ltc",
+        "DOGE": "doge",
+        "BCY": "bcy",
+        "DASH": "dash",
+    }
+    _CHAIN_MAP = {"main": "main", "test": "test"}
+
     def _clean_tx(self, element):
         new_element = wallet_pb2.Transaction()
         new_element.txid = element["hash"]
@@ -103,19 +146,11 @@ class BlockcypherClient(AddressProvider):
         )
         self.api_key = kwargs.get("blockcypher_token")
         self.height = -1
-        coin_map = {
-            "BTC": "btc",
-            "LTC": "ltc",
-            "DOGE": "doge",
-            "BCY": "bcy",
-            "DASH": "dash",
-        }
-        self.coin = coin_map.get(coin.upper())
+        self.coin = self._COIN_MAP.get(coin.upper())
         if not self.coin:
             raise ValueError(f"Undefined coin '{coin}'")
 
-        chain_map = {"main": "main", "test": "test"}
-        self.chain = chain_map.get(chain)
+        self.chain = self._CHAIN_MAP.get(chain)
         if not self.chain:
             raise ValueError(f"Undefined chain '{chain}'")
 
@@ -1,4 +1,3 @@
-from functools import reduce
 import requests
 
 from urllib3 import Retry
@@ -29,6 +28,9 @@ class EsploraClient(AddressProvider):
     for unrelated reasons.
     """
 
+    _COIN_MAP = {"BTC": "btc"}
+    _CHAIN_MAP = {"main": "main", "test": "test"}
+
     # XXX Esplora does have a "get all the transactions in the mempool"
     # endpoint but its situation is similar to the full node provider in
     # that an external database would be required to store all that data,
@@ -129,14 +131,12 @@ class EsploraClient(AddressProvider):
         self.db_connection_parameters = kwargs.get("db_connection_parameters")
 
         self.height = -1
-        coin_map = {"BTC": "btc"}
-        self.coin = coin_map.get(coin.upper())
+        self.coin = self._COIN_MAP.get(coin.upper())
         if not self.coin:
             raise ValueError(f"Unsupported coin '{coin}'")
         self.endpoint = kwargs.get("base_url", kwargs.get("url"))
 
-        chain_map = {"main": "main", "test": "test"}
-        self.chain = chain_map.get(chain)
+        self.chain = self._CHAIN_MAP.get(chain)
         if not self.chain:
             raise ValueError(f"Unsupported chain '{chain}'")
         assert self._chain_is_correct(self.chain)
@@ -1,5 +1,3 @@
-from functools import reduce
-
 import json
 import multiprocessing
 from Cryptodome import Random
@@ -54,6 +52,16 @@ class RPCClient(AddressProvider):
     Requires a node running with -txindex.
     """
 
+    _COIN_MAP = {
+        "BTC": 0,
+        "LTC": 1,
+        "DOGE": 2,
+        "DASH": 3,
+    }
+    _CHAIN_MAP = {"main": 0, "test": 1}
+    # Default RPC port of each coin, indexed by [coin][chain]
+    _PORT_MAP = ((8332, 18332), (9332, 19332), (22555, 44555), (9998, 19998))
+
     # Not static because we need to make calls to fetch input transactions.
     def _clean_tx(self, element, block_height, sql_transaction_storage):
         new_element = wallet_pb2.Transaction()
@@ -117,24 +125,15 @@ class RPCClient(AddressProvider):
 
         use_auth = self.rpc_user or self.rpc_password
 
-        coin_map = {
-            "BTC": 0,
-            "LTC": 1,
-            "DOGE": 2,
-            "DASH": 3,
-        }
-        self.coin = coin_map.get(coin.upper())
+        self.coin = self._COIN_MAP.get(coin.upper())
         if self.coin is None:
             raise ValueError(f"Undefined coin '{coin}'")
 
-        chain_map = {"main": 0, "test": 1}
-        self.chain = chain_map.get(chain)
+        self.chain = self._CHAIN_MAP.get(chain)
         if self.chain is None:
             raise ValueError(f"Undefined chain '{chain}'")
 
-        port_map = [[8332, 18332], [9332, 19332], [22555, 445555], [9998, 19998]]
-
-        self.rpc_port = kwargs.get("port") or port_map[self.coin][self.chain]
+        self.rpc_port = kwargs.get("port") or self._PORT_MAP[self.coin][self.chain]
         self.rpc_url = (
             f"{self.rpc_host}://{'' if use_auth else self.rpc_user + ':' + self.rpc_password + '@'}"
             + f"{self.rpc_host}:{self.rpc_port}"
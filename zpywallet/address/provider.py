@@ -1,7 +1,27 @@
-from functools import reduce
 from ..generated import wallet_pb2
 
 
+def deduplicate(elements):
+    """Removes duplicate elements from a list, keeping the first occurrence.
+
+    Protobuf messages are not hashable, so they are compared by their
+    serialization. This keeps it linear instead of comparing every element
+    with all of the ones kept so far.
+    """
+    seen = set()
+    result = []
+    for element in elements:
+        key = (
+            element.SerializeToString(deterministic=True)
+            if hasattr(element, "SerializeToString")
+            else element
+        )
+        if key not in seen:
+            seen.add(key)
+            result.append(element)
+    return result
+
+
 class AddressProvider(object):
     """
     A class representing a list of crypto addresses.
@@ -13,7 +33,7 @@ class AddressProvider(object):
     HTTPS_ADAPTER = "https://"
 
     def deduplicate(self, elements):
-        return reduce(lambda re, x: re + [x] if x not in re else re, elements, [])
+        return deduplicate(elements)
 
     def __init__(
         self,
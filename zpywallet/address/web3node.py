@@ -1,5 +1,3 @@
-from functools import reduce
-
 import web3
 from web3 import Web3, middleware
 from web3.gas_strategies.time_based import fast_gas_price_strategy
@@ -9,10 +7,7 @@ from zpywallet.address.cache import SQLTransactionStorage, DatabaseError
 from ..errors import NetworkException
 from ..generated import wallet_pb2
 from ..utils.keccak import to_checksum_address
-
-
-def deduplicate(elements):
-    return reduce(lambda re, x: re + [x] if x not in re else re, elements, [])
+from .provider import deduplicate
 
 
 class Web3Client:
@@ -33,6 +28,9 @@ class Web3Client:
     but ensure it is turned off if you are running your own node.
     """
 
+    _COIN_MAP = {"ETH": 0}
+    _CHAIN_MAP = {"main": 0, "sepolia": 1}
+
     def _clean_tx(self, element, block):
         new_element = wallet_pb2.Transaction()
         new_element.txid = element["hash"]
@@ -62,15 +60,11 @@ class Web3Client:
     def __init__(
         self, addresses, coin="ETH", chain="main", transactions=None, **kwargs
     ):
-        coin_map = {
-            "ETH": 0,
-        }
-        self.coin = coin_map.get(coin.upper())
+        self.coin = self._COIN_MAP.get(coin.upper())
         if self.coin is None:
             raise ValueError(f"Undefined coin '{coin}'")
 
-        chain_map = {"main": 0, "sepolia": 1}
-        self.chain = chain_map.get(chain)
+        self.chain = self._CHAIN_MAP.get(chain)
         if self.chain is None:
             raise ValueError(f"Undefined chain '{chain}'")
 
@@ -51,10 +51,11 @@ class Destination:
                 If False, returns the amount in the lowest denomination. Defaults to True.
         """
         if not in_standard_units:
+            # Round rather than truncate: 0.29 * 1e8 is 28999999.999999996.
             if self._network.SUPPORTS_EVM:
-                return int(self._amount * 1e18)
+                return round(self._amount * 1e18)
             else:
-                return int(self._amount * 1e8)
+                return round(self._amount * 1e8)
         else:
             return self._amount
 
@@ -248,7 +248,7 @@ class Mnemonic(object):
             raise ValueError("Provided seed should have length of 64")
 
         # Compute HMAC-SHA512 of seed
-        seed = hmac.new(b"Bitcoin seed", seed, digestmod=hashlib.sha512).digest()
+        seed = hmac.digest(b"Bitcoin seed", seed, hashlib.sha512)
 
         # Serialization format can be found at:
         # https://github.com/bitcoin/bips/blob/master/bip-0032.mediawiki#serialization-format
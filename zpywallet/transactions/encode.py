@@ -16,6 +16,10 @@ from typing import List
 
 SIGHASH_ALL = 1
 
+# Single-byte varints cover every script/count length below 0xFD, which is
+# nearly every length prefix we emit, so build them once.
+_SHORT_VARINTS = tuple(bytes([i]) for i in range(0xFD))
+
 
 def script_is_p2pkh(script):
     return (
@@ -42,8 +46,10 @@ def int_to_hex(i, min_bytes=1):
 
 
 def create_varint(value):
-    if value < 0xFD:
-        return int_to_hex(value, min_bytes=1)
+    if 0 <= value < 0xFD:
+        return _SHORT_VARINTS[value]
+    elif value < 0:
+        raise OverflowError("can't convert negative int to unsigned")
     elif value <= 0xFFFF:
         return b"\xfd" + int_to_hex(value, min_bytes=2)
     elif value <= 0xFFFFFFFF:
@@ -337,7 +343,7 @@ def create_transaction(
         input_bytes_3 = int_to_hex(
             0xFFFFFFFD, 4
         )  # see https://bitcointalk.org/index.php?topic=5479540.msg63401889#msg63401889
-        inputs[num]._output["nsequence"] = input_bytes_3
+        inputs[num]._output.nsequence = input_bytes_3
 
         segwit_payload = b""
         # It is easier to prepare the Segwit signing data here.
@@ -36,6 +36,21 @@ BLOCK_SIZE = 16
 KEY_LEN = 32
 NONCE_LEN = 12
 
+# Ciphertexts start with one of these markers. "Salted__" is the original
+# PBKDF2 format, which is still decrypted but no longer written.
+PBKDF2_MAGIC = b"Salted__"
+SCRYPT_MAGIC = b"Scrypt__"
+SCRYPT_SALT_LEN = 16
+# scrypt cost parameters: N = 2**15 and r = 8 use 32 MiB of memory.
+SCRYPT_LOG2_N = 15
+SCRYPT_R = 8
+SCRYPT_P = 1
+# The parameters are read from the ciphertext, so decrypt() refuses any above
+# these limits: at most 64 MiB of memory and 8 times the default work.
+SCRYPT_MAX_LOG2_N = 16
+SCRYPT_MAX_R = 8
+SCRYPT_MAX_P = 4
+
 
 def hash_password_pbkdf2(
     password: bytes, salt: bytes, iterations=600000, key_length=128
@@ -44,6 +59,27 @@ def hash_password_pbkdf2(
     return hashlib.pbkdf2_hmac("sha256", password + salt, salt, iterations, key_length)
 
 
+def hash_password_scrypt(
+    password: bytes,
+    salt: bytes,
+    log2_n=SCRYPT_LOG2_N,
+    r=SCRYPT_R,
+    p=SCRYPT_P,
+    key_length=KEY_LEN + NONCE_LEN,
+):
+    # Hash the password using the memory-hard scrypt KDF
+    n = 1 << log2_n
+    return hashlib.scrypt(
+        password,
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        maxmem=129 * r * n + (1 << 20),
+        dklen=key_length,
+    )
+
+
 def encrypt(raw: bytes, passphrase: bytes) -> bytes:
     """
     Encrypt binary data with the passphrase
@@ -55,11 +91,40 @@ def encrypt(raw: bytes, passphrase: bytes) -> bytes:
     Returns:
         bytes: The encrypted text
     """
-    salt = Random.new().read(8)
-    key, nonce = __derive_key_and_nonce(passphrase, salt)
-    cipher = AES.new(key, AES.MODE_SIV, nonce)
-    text, mac = cipher.encrypt_and_digest(__pkcs7_padding(raw))
-    return base64.b64encode(b"Salted__" + salt + mac + text)
+    return encrypt_many([raw], passphrase)[0]
+
+
+def encrypt_many(raws, passphrase: bytes):
+    """
+    Encrypt several pieces of binary data with the same passphrase
+
+    The key derivation is by far the most expensive part of encrypt(), so this
+    derives the key only once and uses it for every piece of data. Each result
+    can be decrypted with decrypt() on its own. The results share a salt, but
+    since AES-SIV is a deterministic AEAD that only reveals whether two of the
+    pieces of data are identical.
+
+    The key is derived with scrypt, and its parameters and salt are stored in
+    front of the ciphertext.
+
+    Args:
+        raws (List[bytes]): data to encrypt
+        passphrase (bytes): Encryption password. It is recommended to use a strong password.
+
+    Returns:
+        List[bytes]: The encrypted texts, in the same order as raws
+    """
+    salt = Random.new().read(SCRYPT_SALT_LEN)
+    header = SCRYPT_MAGIC + bytes([SCRYPT_LOG2_N, SCRYPT_R, SCRYPT_P]) + salt
+    d = hash_password_scrypt(passphrase, salt)
+    key, nonce = d[:KEY_LEN], d[KEY_LEN:]
+    encrypted = []
+    for raw in raws:
+        # SIV cipher objects cannot be reused once they have been finalized
+        cipher = AES.new(key, AES.MODE_SIV, nonce)
+        text, mac = cipher.encrypt_and_digest(__pkcs7_padding(raw))
+        encrypted.append(base64.b64encode(header + mac + text))
+    return encrypted
 
 
 def encrypt_str(raw: str, passphrase: str) -> str:
@@ -67,6 +132,13 @@ def encrypt_str(raw: str, passphrase: str) -> str:
     return encrypt(raw.encode("utf-8"), passphrase.encode("utf-8"))
 
 
+def encrypt_str_many(raws, passphrase: str):
+    """A wrapper around encrypt_many() for str objects"""
+    return encrypt_many(
+        [raw.encode("utf-8") for raw in raws], passphrase.encode("utf-8")
+    )
+
+
 def decrypt(enc: bytes, passphrase: bytes) -> bytes:
     """
     Decrypt encrypted binary data with the passphrase
@@ -80,15 +152,29 @@ def decrypt(enc: bytes, passphrase: bytes) -> bytes:
         bytes: The original text
     """
     ct = base64.b64decode(enc)
-    salted = ct[:8]
-    if salted != b"Salted__":
+    magic = ct[:8]
+    if magic == SCRYPT_MAGIC:
+        log2_n, r, p = ct[8:11]
+        if not (
+            1 <= log2_n <= SCRYPT_MAX_LOG2_N
+            and 1 <= r <= SCRYPT_MAX_R
+            and 1 <= p <= SCRYPT_MAX_P
+        ):
+            raise ValueError("Decryption failed")
+        salt = ct[11 : 11 + SCRYPT_SALT_LEN]
+        d = hash_password_scrypt(passphrase, salt, log2_n, r, p)
+        key, nonce = d[:KEY_LEN], d[KEY_LEN:]
+        ct = ct[11 + SCRYPT_SALT_LEN :]
+    elif magic == PBKDF2_MAGIC:
+        salt = ct[8:16]
+        key, nonce = __derive_key_and_nonce(passphrase, salt)
+        ct = ct[16:]
+    else:
         raise ValueError("Decryption failed")
-    salt = ct[8:16]
-    key, nonce = __derive_key_and_nonce(passphrase, salt)
     cipher = AES.new(key, AES.MODE_SIV, nonce)
 
-    mac = ct[16:32]
-    text = ct[32:]
+    mac = ct[:16]
+    text = ct[16:]
 
     # Will throw ValueError if the authentication tag was tampered with
     d = __pkcs7_trimming(cipher.decrypt_and_verify(text, mac))
@@ -123,6 +209,10 @@ def __pkcs7_trimming(s):
 
 
 def __derive_key_and_nonce(password, salt):
+    # Key derivation of the legacy PBKDF2 format. One call already returns
+    # 128 bytes, four PBKDF2-SHA256 blocks, but the 44 bytes of key and nonce
+    # only need the first two. Testing a password therefore takes about half
+    # the work that deriving the key here does.
     d = d_i = b""
     enc_pass = password
     while len(d) < KEY_LEN + NONCE_LEN:
@@ -33,12 +33,15 @@ def b58encode_int(
     """
     if not i and default_one:
         return alphabet[0:1]
-    string = b""
+    # Collect the digits least significant first and reverse once at the end,
+    # rather than prepending to an immutable bytes object for every digit.
+    digits = bytearray()
     base = len(alphabet)
     while i:
         i, idx = divmod(i, base)
-        string = alphabet[idx : idx + 1] + string
-    return string
+        digits.append(alphabet[idx])
+    digits.reverse()
+    return bytes(digits)
 
 
 def b58encode(v: Union[str, bytes], alphabet: bytes = BITCOIN_ALPHABET) -> bytes:
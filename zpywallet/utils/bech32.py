@@ -23,6 +23,7 @@
 
 
 from enum import Enum
+from functools import lru_cache
 
 
 class Encoding(Enum):
@@ -36,15 +37,17 @@ CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
 BECH32M_CONST = 0x2BC830A3
 
 
-def bech32_polymod(values):
+BECH32_GENERATOR = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+
+
+def bech32_polymod(values, chk=1):
     # Internal function that computes the Bech32 checksum.
-    generator = [0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3]
-    chk = 1
+    # chk may be a state returned by a previous call, to continue from it.
     for value in values:
         top = chk >> 25
         chk = (chk & 0x1FFFFFF) << 5 ^ value
         for i in range(5):
-            chk ^= generator[i] if ((top >> i) & 1) else 0
+            chk ^= BECH32_GENERATOR[i] if ((top >> i) & 1) else 0
     return chk
 
 
@@ -53,9 +56,16 @@ def bech32_hrp_expand(hrp):
     return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
 
 
+@lru_cache()
+def _bech32_hrp_polymod(hrp):
+    # The checksum state after the expanded HRP. A network always uses the
+    # same HRP, so this only has to be computed once per network.
+    return bech32_polymod(bech32_hrp_expand(hrp))
+
+
 def bech32_verify_checksum(hrp, data):
     """Verify a checksum given HRP and converted data characters."""
-    const = bech32_polymod(bech32_hrp_expand(hrp) + data)
+    const = bech32_polymod(data, _bech32_hrp_polymod(hrp))
     if const == 1:
         return Encoding.BECH32
     if const == BECH32M_CONST:
@@ -65,9 +75,10 @@ def bech32_verify_checksum(hrp, data):
 
 def bech32_create_checksum(hrp, data, spec):
     # Compute the checksum values given HRP and data.
-    values = bech32_hrp_expand(hrp) + data
     const = BECH32M_CONST if spec == Encoding.BECH32M else 1
-    polymod = bech32_polymod(values + [0, 0, 0, 0, 0, 0]) ^ const
+    polymod = (
+        bech32_polymod(data + [0, 0, 0, 0, 0, 0], _bech32_hrp_polymod(hrp)) ^ const
+    )
     return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
 
 
@@ -147,7 +158,19 @@ def bech32_encode(hrp, witver, witprog):
     spec = Encoding.BECH32 if witver == 0 else Encoding.BECH32M
     if len(witprog) < 2 or len(witprog) > 40:
         raise ValueError("Witness program must be between 2 and 40 bytes")
-    ret = _bech32_encode(hrp, [witver] + convertbits(witprog, 8, 5), spec)
-    if bech32_decode(hrp, ret) == (None, None):
+    if not 0 <= witver <= 16:
+        raise ValueError("Witness version must be between 0 and 16")
+    if witver == 0 and len(witprog) != 20 and len(witprog) != 32:
+        raise ValueError("Version 0 witness program must be 20 or 32 bytes")
+    data = [witver] + convertbits(witprog, 8, 5)
+    # These are the checks bech32_decode would apply to the encoded string.
+    # The data part is always valid lowercase, so only the HRP and the total
+    # length need checking, and decoding the result again is unnecessary.
+    if (
+        not hrp
+        or hrp.lower() != hrp
+        or any(ord(x) < 33 or ord(x) > 126 for x in hrp)
+        or len(hrp) + len(data) + 7 > 90
+    ):
         raise ValueError("Bech32 encode failed for this address")
-    return ret
+    return _bech32_encode(hrp, data, spec)
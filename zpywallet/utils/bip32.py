@@ -4,17 +4,16 @@ Module for generating Heirarchical Deterministic (HD) keys for supported network
 """
 
 from binascii import hexlify, unhexlify
+from functools import cached_property
 from hashlib import sha256, sha512
 import hmac
 from os import urandom
+import struct
 import time
-import re
-
-import coincurve
 
 from .base58 import b58encode_check, b58decode_check
 from ..mnemonic.mnemonic import Mnemonic
-from .keys import PrivateKey, PublicKey, Point, secp256k1
+from .keys import PrivateKey, PublicKey, secp256k1
 from ..errors import (
     incompatible_network_bytes_exception_factory,
     InvalidChildException,
@@ -28,56 +27,104 @@ from .ripemd160 import ripemd160
 # import all the networks
 from ..network import BitcoinSegwitMainNet
 
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+# Extended key layout: version, depth, parent fingerprint, child number,
+# chain code and key data.
+_XKEY_STRUCT = struct.Struct(">IB4sI32s33s")
+# Network attribute holding the extended key version bytes, keyed by
+# (use private key, use segwit).
+_XKEY_VERSION_ATTRS = {
+    (True, True): "EXT_SEGWIT_SECRET_KEY",
+    (True, False): "EXT_SECRET_KEY",
+    (False, True): "EXT_SEGWIT_PUBLIC_KEY",
+    (False, False): "EXT_PUBLIC_KEY",
+}
+# Big-endian child index, as appended to the HMAC data in child derivation.
+_pack_u32 = struct.Struct(">I").pack
+
+
+def _hmac_sha512_factory(key: bytes, prefix: bytes = b""):
+    """Return a function computing HMAC-SHA512(key, prefix || msg) for a
+    fixed key and message prefix.
+
+    HMAC is H(k ^ opad || H(k ^ ipad || m)). The two padded key blocks are
+    hashed only once here, and every call just clones those hash states, which
+    is much cheaper than setting up a new HMAC when deriving many siblings
+    from the same chain code. The prefix (the parent's key data) is absorbed
+    into the inner state once as well, so each call only hashes the suffix.
+    """
+    # Keys longer than the 128-byte block size are hashed first, per RFC 2104
+    if len(key) > 128:
+        key = sha512(key).digest()
+    key = key.ljust(128, b"\x00")
+    inner = sha512(bytes(b ^ 0x36 for b in key))
+    inner.update(prefix)
+    outer = sha512(bytes(b ^ 0x5C for b in key))
+
+    def hmac_sha512(msg: bytes) -> bytes:
+        ihash = inner.copy()
+        ihash.update(msg)
+        ohash = outer.copy()
+        ohash.update(ihash.digest())
+        return ohash.digest()
+
+    return hmac_sha512
+
 
 def is_hex_string(string):
     """Check if the string is only composed of hex characters."""
-    pattern = re.compile(r"[A-Fa-f0-9]+")
-    if isinstance(string, bytes):
-        string = str(string)
-    return pattern.match(string) is not None
+    if isinstance(string, str):
+        string = string.encode("utf-8")
+    # Deleting every hex digit leaves nothing behind only for a hex string
+    return len(string) > 0 and not string.translate(None, _HEX_DIGITS)
 
 
 def long_to_hex(l, size):
     """Encode a long value as a hex string, 0-padding to size.
 
     Note that size is the size of the resulting hex string. So, for a 32Byte
-    long size should be 64 (two hex characters per byte"."""
-    f_str = "{0:0%sx}" % size
-    return f_str.format(l).lower().encode("utf-8")
+    long size should be 64 (two hex characters per byte".
+
+    Raises OverflowError if the value does not fit in size."""
+    if size % 2:
+        if l < 0 or l.bit_length() > size * 4:
+            raise OverflowError("int too big to convert")
+        return f"{l:0{size}x}".encode("ascii")
+    return hexlify(l.to_bytes(size // 2, "big"))
 
 
 def hex_check_length(val, hex_len):
     if isinstance(val, int):
-        return long_to_hex(val, hex_len)
-    elif (isinstance(val, str) or isinstance(val, bytes)) and is_hex_string(val):
-        if isinstance(val, str):
-            val = val.encode("utf-8")
-        if len(val) != hex_len:
-            raise ValueError("Invalid parameter length")
-        return val
-    else:
+        try:
+            return long_to_hex(val, hex_len)
+        except OverflowError:
+            raise ValueError("Invalid parameter length") from None
+    if isinstance(val, str):
+        val = val.encode("utf-8")
+    if not isinstance(val, bytes) or not is_hex_string(val):
         raise ValueError("Invalid parameter type")
+    if len(val) != hex_len:
+        raise ValueError("Invalid parameter length")
+    return val
 
 
 def hex_int(val):
     if isinstance(val, int):
-        return int(val)
-    elif isinstance(val, str) or isinstance(val, bytes):
-        if isinstance(val, str):
-            val = val.encode("utf-8")
-        if not is_hex_string(val):
-            val = hexlify(val)
-        return int(val, 16)
-    else:
+        return val
+    if isinstance(val, str):
+        val = val.encode("utf-8")
+    elif not isinstance(val, bytes):
         raise ValueError("parameter must be an int or long")
+    if not is_hex_string(val):
+        return int.from_bytes(val, "big")
+    return int(val, 16)
 
 
 def bytes_int(byte_seq):
-    return (
-        int(hexlify(byte_seq), 16)
-        if byte_seq is None or isinstance(byte_seq, int)
-        else byte_seq
-    )
+    if isinstance(byte_seq, bytes):
+        return int.from_bytes(byte_seq, "big")
+    return byte_seq
 
 
 class HDWallet(object):
@@ -137,6 +184,9 @@ class HDWallet(object):
             raise ValueError("You must supply one of private_exponent or public_pair")
 
         self.mnemonic = mnemonic
+        # Set by from_mnemonic, since the mnemonic alone then does not
+        # reproduce this key
+        self.has_passphrase = False
         self.private_key = None
         self.public_key = None
         if private_key:
@@ -172,7 +222,7 @@ class HDWallet(object):
         """Get the sec1 representation of the public key."""
         return self.public_key.to_hex(compressed).encode("utf-8")
 
-    @property
+    @cached_property
     def identifier(self):
         """Get the identifier for this node.
 
@@ -183,8 +233,13 @@ class HDWallet(object):
         way (and wallet software is not required to accept payment to the chain
         key itself).
         """
-        key = self.get_public_key_hex()
-        return hexlify(ripemd160(sha256(unhexlify(key)).digest()))
+        # Cached, since every child derivation needs the parent's fingerprint.
+        # The public key caches the same hash for its addresses, so share it
+        # unless the network has no use for it (hex addresses).
+        ripe = self.public_key.hash160()
+        if ripe is None:
+            ripe = ripemd160(sha256(self.public_key.to_bytes()).digest())
+        return hexlify(ripe)
 
     @property
     def mnemonic_phrase(self):
@@ -195,7 +250,7 @@ class HDWallet(object):
         """
         return self.mnemonic
 
-    @property
+    @cached_property
     def fingerprint(self):
         """The first 32 bits of the identifier are called the fingerprint."""
         # 32 bits == 4 Bytes == 8 hex characters
@@ -316,61 +371,125 @@ class HDWallet(object):
             # Even though we take child_number as an int < boundary, the
             # internal derivation needs it to be the larger number.
             child_number = child_number + boundary
-        child_number_hex = long_to_hex(child_number, 8)
 
         if is_prime:
             # Let data = concat(0x00, self.key, child_number)
-            data = b"00" + self.private_key.to_hex().encode("utf-8")
+            data = b"\x00" + bytes(self.private_key)
         else:
-            data = self.get_public_key_hex()
-        data += child_number_hex
+            data = self.public_key.to_bytes()
+        data += _pack_u32(child_number)
 
         # Compute a 64 Byte I that is the HMAC-SHA512, using self.chain_code
         # as the seed, and data as the message.
-        ichild = hmac.new(
-            unhexlify(self.chain_code),
-            msg=unhexlify(data),
-            digestmod=sha512,
-        ).digest()
+        ichild = hmac.digest(unhexlify(self.chain_code), data, sha512)
         # Split I into its 32 Byte components.
         ichild_left, ichild_right = ichild[:32], ichild[32:]
+        ichild_left_int = int.from_bytes(ichild_left, "big")
 
-        if int(hexlify(ichild_left), 16) >= secp256k1.N:
+        if ichild_left_int >= secp256k1.N:
             raise InvalidPathError("The derived key is too large.")
 
         c_i = hexlify(ichild_right)
         private_exponent = None
-        point = None
+        public_key = None
         if self.private_key:
             # Use private information for derivation
             # I_L is added to the current key's secret exponent (mod n), where
             # n is the order of the ECDSA curve in use.
             private_exponent = (
-                int(hexlify(ichild_left), 16)
-                + int(self.private_key.to_hex().encode("utf-8"), 16)
+                ichild_left_int + int.from_bytes(bytes(self.private_key), "big")
             ) % secp256k1.N
             # I_R is the child's chain code
         else:
             # Only use public information for this derivation
-            gen = coincurve.PublicKey.from_point(secp256k1.Gx, secp256k1.Gy)
-            point = Point(
-                *gen.multiply(ichild_left).add(self.public_key.to_bytes()).point()
-            )
+            # K_i = K_par + I_L*G, which libsecp256k1 computes as a single
+            # tweak-add instead of a multiplication followed by an addition.
+            ckey = self.public_key._key.add(ichild_left)
+            public_key = PublicKey(ckey, network=self.network)
             # I_R is the child's chain code
 
         child = self.__class__(
             chain_code=c_i,
             depth=self.depth + 1,  # we have to go deeper...
             parent_fingerprint=self.fingerprint,
-            child_number=child_number_hex,
+            child_number=child_number,
             private_exponent=private_exponent,
-            public_pair=point,
+            public_key=public_key,
             network=self.network,
         )
         if not as_private:
             return child.public_copy()
         return child
 
+    def get_children(self, child_numbers, is_prime: bool = False, as_private=True):
+        """Derive several sibling child keys at once.
+
+        This gives the same result as calling `get_child` for each child
+        number, but the parent's chain code, key data and fingerprint are
+        only computed once, which makes scanning many addresses much faster.
+        Watch-only wallets derive their children with one elliptic curve
+        point addition each.
+
+        Args:
+            child_numbers (Iterable[int]): The numbers of the child keys to
+                compute
+            is_prime (bool): If True, the children are calculated via private
+                derivation.
+            as_private: If False, strips private keys from the results.
+
+        Returns:
+            list: A list of HDWallet children, in the order of child_numbers.
+        """
+        if not self.private_key and is_prime:
+            raise WatchOnlyWalletError(
+                "Cannot compute a prime child without a private key"
+            )
+
+        boundary = 0x80000000
+        parent_fingerprint = self.fingerprint
+        if is_prime:
+            data = b"\x00" + bytes(self.private_key)
+        else:
+            data = self.public_key.to_bytes()
+        hmac_sha512 = _hmac_sha512_factory(unhexlify(self.chain_code), data)
+        if self.private_key:
+            parent_exponent = int.from_bytes(bytes(self.private_key), "big")
+        else:
+            parent_point = self.public_key._key
+
+        children = []
+        for child_number in child_numbers:
+            if child_number >= boundary or child_number < 0:
+                raise InvalidPathError(f"Invalid child number {child_number}")
+            if is_prime:
+                child_number += boundary
+
+            ichild = hmac_sha512(_pack_u32(child_number))
+            ichild_left = int.from_bytes(ichild[:32], "big")
+            if ichild_left >= secp256k1.N:
+                raise InvalidPathError("The derived key is too large.")
+
+            private_exponent = None
+            public_key = None
+            if self.private_key:
+                private_exponent = (ichild_left + parent_exponent) % secp256k1.N
+            else:
+                # K_i = K_par + I_L*G, see get_child
+                ckey = parent_point.add(ichild[:32])
+                public_key = PublicKey(ckey, network=self.network)
+
+            child = self.__class__(
+                chain_code=hexlify(ichild[32:]),
+                depth=self.depth + 1,
+                parent_fingerprint=parent_fingerprint,
+                child_number=child_number,
+                private_exponent=private_exponent,
+                public_key=public_key,
+                network=self.network,
+            )
+            children.append(child if as_private else child.public_copy())
+        return children
+
     def public_copy(self):
         """Clone this wallet and strip it of its private information."""
         return self.__class__(
@@ -378,7 +497,9 @@ class HDWallet(object):
             depth=self.depth,
             parent_fingerprint=self.parent_fingerprint,
             child_number=self.child_number,
-            public_pair=self.public_key.to_point(),
+            # PublicKey is immutable, so share it instead of round-tripping
+            # through its affine coordinates.
+            public_key=self.public_key,
             network=self.network,
         )
 
@@ -413,11 +534,8 @@ class HDWallet(object):
             )
 
         # Duplicate the public child derivation
-        child_number_hex = long_to_hex(child_private_key.child_number, 8)
-        data = self.get_public_key_hex() + child_number_hex
-        ichild = hmac.new(
-            unhexlify(self.chain_code), msg=unhexlify(data), digestmod=sha512
-        ).digest()
+        data = self.public_key.to_bytes() + _pack_u32(child_private_key.child_number)
+        ichild = hmac.digest(unhexlify(self.chain_code), data, sha512)
         ichild_left, _ = ichild[:32], ichild[32:]
         # Public derivation is the same as private derivation plus some offset
         # knowing the child's private key allows us to find this offset just
@@ -433,6 +551,39 @@ class HDWallet(object):
             network=self.network,
         )
 
+    def _dump_xkey_bytes(self, private: bool = True, segwit: bool = False):
+        """Serialize this key to raw bytes. See `dump_xkey` for the arguments."""
+
+        if private and not self.private_key:
+            raise WatchOnlyWalletError("Private key is not available")
+
+        # Look up the version bytes for (use private key, use segwit)
+        network_version = getattr(
+            self.network, _XKEY_VERSION_ATTRS[(private, segwit)], None
+        )
+        if not network_version:
+            if segwit:
+                raise SegwitError("Segwit is not supported on this network")
+            raise unsupported_feature_exception_factory(
+                self.network.NAME,
+                "private key serialization" if private else "public key serialization",
+            )
+
+        # Private and public serializations are slightly different
+        if private:
+            key_data = b"\x00" + bytes(self.private_key)
+        else:
+            key_data = self.public_key.to_bytes(compressed=True)
+
+        return _XKEY_STRUCT.pack(
+            network_version,
+            self.depth,
+            unhexlify(self.parent_fingerprint),
+            self.child_number,
+            unhexlify(self.chain_code),
+            key_data,
+        )
+
     def dump_xkey(self, private: bool = True, segwit: bool = False):
         """Serialize this key.
 
@@ -449,69 +600,11 @@ class HDWallet(object):
 
         See the spec in `load_xkey` for more details.
         """
-
-        if private and not self.private_key:
-            raise WatchOnlyWalletError("Private key is not available")
-
-        # Define the mapping for the conditions and corresponding actions
-        # Args are (use private key, use segwit)
-        condition_action_map = {
-            (True, True): (
-                lambda self: (
-                    lambda: self.network.EXT_SEGWIT_SECRET_KEY,
-                    lambda: SegwitError("Segwit is not supported on this network"),
-                )
-            ),
-            (True, False): (
-                lambda self: (
-                    lambda: self.network.EXT_SECRET_KEY,
-                    lambda: unsupported_feature_exception_factory(
-                        self.network.NAME, "private key serialization"
-                    ),
-                )
-            ),
-            (False, True): (
-                lambda self: (
-                    lambda: self.network.EXT_SEGWIT_PUBLIC_KEY,
-                    lambda: SegwitError("Segwit is not supported on this network"),
-                )
-            ),
-            (False, False): (
-                lambda self: (
-                    lambda: self.network.EXT_PUBLIC_KEY,
-                    lambda: unsupported_feature_exception_factory(
-                        self.network.NAME, "public key serialization"
-                    ),
-                )
-            ),
-        }
-
-        # Get the appropriate functions based on conditions
-        network_version_func, error_func = condition_action_map[(private, segwit)](self)
-
-        # Check conditions and take corresponding actions
-        if not network_version_func():
-            raise error_func()
-
-        network_version = long_to_hex(network_version_func(), 8)
-
-        depth = long_to_hex(self.depth, 2)
-        parent_fingerprint = self.parent_fingerprint
-        child_number = long_to_hex(self.child_number, 8)
-        chain_code = self.chain_code
-        ret = network_version + depth + parent_fingerprint + child_number + chain_code
-        # Private and public serializations are slightly different
-        if private:
-            ret += b"00" + self.private_key.to_hex().encode("utf-8")
-        else:
-            ret += self.get_public_key_hex(compressed=True)
-        return ret.lower()
+        return hexlify(self._dump_xkey_bytes(private, segwit))
 
     def dump_str_xkey(self, private=True, segwit=False) -> str:
         """Encode the serialized node in base58."""
-        return b58encode_check(unhexlify(self.dump_xkey(private, segwit))).decode(
-            "utf-8"
-        )
+        return b58encode_check(self._dump_xkey_bytes(private, segwit)).decode("utf-8")
 
     def address(self, compressed: bool = True, witness_version: int = 0):
         """Create a public address from this Wallet.
@@ -530,9 +623,10 @@ class HDWallet(object):
         Returns:
             str: An encoded address
         """
-        key = PublicKey.from_bytes(
-            unhexlify(self.get_public_key_hex()), network=self.network
-        )
+        key = self.public_key
+        if key.network is not self.network:
+            # Keys loaded from a public pair carry the default network
+            key = PublicKey.from_bytes(key.to_bytes(), network=self.network)
         return key.address(compressed=compressed, witness_version=witness_version)
 
     @classmethod
@@ -586,16 +680,14 @@ class HDWallet(object):
             key[45:78],
         )
 
-        if int(depth) == 0 and int(hexlify(parent_fingerprint), 16) != 0:
+        if depth == 0 and parent_fingerprint != b"\x00\x00\x00\x00":
             raise ValueError("Zero depth with non-zero parent fingerprint")
-        if int(depth) == 0 and int(hexlify(child)) != 0:
+        if depth == 0 and child != b"\x00\x00\x00\x00":
             raise ValueError("Zero depth with non-zero index")
-        version_long = int(hexlify(version), 16)
+        version_long = int.from_bytes(version, "big")
         exponent = None
         pubkey = None
         point_type = key_data[0]
-        if not isinstance(point_type, int):
-            point_type = ord(point_type)
         if point_type == 0:
             # Private key
             if version_long != network.EXT_SECRET_KEY:
@@ -605,7 +697,7 @@ class HDWallet(object):
                     version,
                 )
             exponent = key_data[1:]
-            iexponent = int(hexlify(exponent), 16)
+            iexponent = int.from_bytes(exponent, "big")
             if iexponent < 1 or iexponent >= secp256k1.N:
                 raise ValueError("Private key is out of range")
         elif point_type in [2, 3, 4]:
@@ -616,7 +708,7 @@ class HDWallet(object):
                     unhexlify(f"{network.EXT_PUBLIC_KEY:x}".zfill(8)),
                     version,
                 )
-            pubkey = PublicKey.from_bytes(key_data)
+            pubkey = PublicKey.from_bytes(key_data, network=network)
         else:
             raise ValueError(f"Invalid key_data prefix, got {point_type}")
 
@@ -642,21 +734,23 @@ class HDWallet(object):
 
         See https://github.com/bitcoin/bips/blob/master/bip-0032.mediawiki#Serialization_format
         """
-        mne = Mnemonic(language="english")
-        seed = mne.to_seed(mnemonic, passphrase)
+        # to_seed is a classmethod, so there is no need to load a wordlist
+        seed = Mnemonic.to_seed(mnemonic, passphrase)
 
         # Given a seed S of at least 128 bits, but 256 is advised
         # Calculate I = HMAC-SHA512(key=HDWallet.bitcoin_seed, msg=S)
-        I = hmac.new(HDWallet.bitcoin_seed, msg=seed, digestmod=sha512).digest()
+        I = hmac.digest(HDWallet.bitcoin_seed, seed, sha512)
         # Split I into two 32-byte sequences, IL and IR.
         il, ir = I[:32], I[32:]
         # Use IL as master secret key, and IR as master chain code.
-        return cls(
-            private_exponent=int(hexlify(il), 16),
+        wallet = cls(
+            private_exponent=int.from_bytes(il, "big"),
             chain_code=hexlify(ir),
             mnemonic=mnemonic,
             network=network,
         )
+        wallet.has_passphrase = bool(passphrase)
+        return wallet
 
     @classmethod
     def from_brainwallet(cls, password: str, network=BitcoinSegwitMainNet):
@@ -677,13 +771,12 @@ class HDWallet(object):
             Wallet: A Wallet object.
         """
         # Make sure the password string is bytes
+        password = password.encode("utf-8")
         data = unhexlify(b"0" * 64)  # 256-bit 0
         for _ in range(50000):
-            data = hmac.new(
-                password.encode("utf-8"), msg=data, digestmod=sha256
-            ).digest()
+            data = hmac.digest(password, data, sha256)
 
-        I = hmac.new(HDWallet.bitcoin_seed, msg=data, digestmod=sha512).digest()
+        I = hmac.digest(HDWallet.bitcoin_seed, data, sha512)
         # Split I into two 32-byte sequences, IL and IR.
         il, ir = I[:32], I[32:]
         # Use IL as master secret key, and IR as master chain code.
@@ -708,7 +801,7 @@ class HDWallet(object):
 
         # Given a seed S of at least 128 bits, but 256 is advised
         # Calculate I = HMAC-SHA512(key=HDWallet.bitcoin_seed, msg=S)
-        I = hmac.new(HDWallet.bitcoin_seed, msg=seed, digestmod=sha512).digest()
+        I = hmac.digest(HDWallet.bitcoin_seed, seed, sha512)
         # Split I into two 32-byte sequences, IL and IR.
         il, ir = I[:32], I[32:]
         # Use IL as master secret key, and IR as master chain code.
@@ -786,7 +879,7 @@ class HDWallet(object):
         """
         seed = str(urandom(64))  # 512/8
         # weak extra protection inspired by pybitcointools implementation:
-        seed += str(int(time.time() * 10**6))
+        seed += str(time.time_ns() // 1000)
         if user_entropy:
             user_entropy = str(user_entropy)  # allow for int/long
             seed += user_entropy
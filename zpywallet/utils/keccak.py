@@ -10,6 +10,12 @@ from operator import xor
 from copy import deepcopy
 from functools import reduce
 from binascii import hexlify
+from string import hexdigits
+
+try:
+    from Cryptodome.Hash import keccak as _c_keccak
+except ImportError:  # pragma: no cover
+    _c_keccak = None
 
 # The round constants used in the Keccak-f permutation.
 RoundConstants = [
@@ -445,6 +451,31 @@ SHA3 parameter preset with a bitrate of 576 bits, a capacity of 1024 bits,
 Keccak512 = KeccakHash.preset(576, 1024, 512)
 
 
+def keccak256(data: bytes) -> bytes:
+    """Computes the Keccak-256 digest of `data` in one shot.
+
+    This dispatches to PyCryptodome's native Keccak implementation when it is
+    available, and falls back to the pure-Python Keccak256 preset otherwise.
+
+    Args:
+        data (bytes): The input to hash.
+
+    Returns:
+        bytes: The 32-byte Keccak-256 digest.
+    """
+    if _c_keccak is not None:
+        return _c_keccak.new(digest_bits=256, data=data).digest()
+    return Keccak256(data).digest()
+
+
+def _checksum_case(address, address_hash):
+    # The nth letter is uppercase if the nth digit of the hash is 8 or more.
+    # Comparing the hex digit characters avoids an int() call per position.
+    return "".join(
+        c.upper() if h in "89abcdef" else c for c, h in zip(address, address_hash)
+    )
+
+
 def to_checksum_address(address):
     """Converts a hexadecimal Ethereum address to its checksum format.
 
@@ -462,15 +493,8 @@ def to_checksum_address(address):
     """
 
     address = address.lower().replace("0x", "")
-    keccak_hash = Keccak256(address.encode("utf-8")).hexdigest()
-    checksum_address = "0x"
-
-    for i in range(len(address)):
-        if int(keccak_hash[i], 16) >= 8:
-            checksum_address += address[i].upper()
-        else:
-            checksum_address += address[i]
-    return checksum_address
+    keccak_hash = keccak256(address.encode("utf-8")).hex()
+    return "0x" + _checksum_case(address, keccak_hash)
 
 
 def is_checksum_address(address):
@@ -484,22 +508,20 @@ def is_checksum_address(address):
 
     Returns:
         bool: True if the address is in checksum format, False otherwise.
+            Anything other than 40 hex digits, with or without the 0x prefix,
+            is not a checksum address.
 
     Example:
-        >>> is_checksum_address("0x123aBc")
+        >>> is_checksum_address("0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed")
         True
     """
 
     address = address.replace("0x", "")
-    address_hash = Keccak256(address.lower().encode("utf-8")).hexdigest()
-
-    for i in range(0, 40):
-        # The nth letter should be uppercase if the nth digit of casemap is 1
-        if (int(address_hash[i], 16) > 7 and address[i].upper() != address[i]) or (
-            int(address_hash[i], 16) <= 7 and address[i].lower() != address[i]
-        ):
-            return False
-    return True
+    if len(address) != 40 or not all(c in hexdigits for c in address):
+        return False
+    lowered = address.lower()
+    address_hash = keccak256(lowered.encode("utf-8")).hex()
+    return address == _checksum_case(lowered, address_hash)
 
 
 def eth_transaction_hash(address: str, nonce: int) -> str:
@@ -508,5 +530,5 @@ def eth_transaction_hash(address: str, nonce: int) -> str:
     data_to_hash = address.lower() + format(nonce, "x")
 
     # Calculate the hash using keccak256
-    transaction_hash = Keccak256(bytes.fromhex(data_to_hash)).digest().hex()
+    transaction_hash = keccak256(bytes.fromhex(data_to_hash)).hex()
     return transaction_hash
@@ -14,10 +14,17 @@ import hashlib
 from hashlib import sha256
 from Crypto import Random
 from collections import namedtuple
+from functools import cached_property
 
 import coincurve
 
-from .keccak import Keccak256
+try:
+    from coincurve.context import GLOBAL_CONTEXT
+    from coincurve.utils import int_to_bytes_padded, validate_secret
+except ImportError:  # pragma: no cover
+    GLOBAL_CONTEXT = None
+
+from .keccak import keccak256
 from .base58 import b58encode_check, b58decode_check
 from .bech32 import bech32_decode, bech32_encode
 from .ripemd160 import ripemd160
@@ -57,7 +64,8 @@ def decode_der_signature(signature):
     # Extract the length of the signature
     length = signature[1]
 
-    assert len(signature[2:]) == length
+    if len(signature) != length + 2:
+        raise ValueError("Invalid DER signature length")
 
     # Find the start and end positions of the R component
     r_start = 4
@@ -77,27 +85,65 @@ def decode_der_signature(signature):
 
 
 def encode_der_signature(r, s):
-    r_bytes = r.to_bytes((r.bit_length() + 7) // 8, byteorder="big", signed=False)
-    s_bytes = s.to_bytes((s.bit_length() + 7) // 8, byteorder="big", signed=False)
+    # Sizing each integer as (bit_length + 8) // 8 bytes reserves the leading
+    # zero byte DER needs whenever the highest bit is set (and encodes 0 as a
+    # single zero byte), so no separate padding step is necessary.
+    r_len = (r.bit_length() + 8) // 8
+    s_len = (s.bit_length() + 8) // 8
+
+    # DER encoding format:
+    # SEQUENCE tag, length, INTEGER tag, length of R, R, INTEGER tag, length of S, S
+    return b"".join(
+        (
+            bytes((0x30, 4 + r_len + s_len, 0x02, r_len)),
+            r.to_bytes(r_len, byteorder="big"),
+            bytes((0x02, s_len)),
+            s.to_bytes(s_len, byteorder="big"),
+        )
+    )
+
+
+class _CoincurvePrivateKey(coincurve.PrivateKey):
+    """coincurve private key that only computes the x-only public key on use.
+
+    coincurve.PrivateKey multiplies the generator twice when it is created,
+    once for the full public key and once for the x-only (BIP340) one. Only
+    the full public key is needed to derive addresses.
+    """
 
-    # Ensure leading zero byte if highest bit is set
-    if r_bytes[0] & 0x80:
-        r_bytes = b"\x00" + r_bytes
-    if s_bytes[0] & 0x80:
-        s_bytes = b"\x00" + s_bytes
+    def __init__(self, secret, context=GLOBAL_CONTEXT):
+        self.secret = validate_secret(secret)
+        self.context = context
+        self.public_key = coincurve.PublicKey.from_valid_secret(self.secret, context)
 
-    # DER encoding format
-    der_signature = bytearray()
-    der_signature.append(0x30)  # SEQUENCE tag
-    der_signature.append(2 + len(r_bytes) + 2 + len(s_bytes))  # Length of SEQUENCE
-    der_signature.append(0x02)  # INTEGER tag for R
-    der_signature.append(len(r_bytes))  # Length of R
-    der_signature.extend(r_bytes)  # R value
-    der_signature.append(0x02)  # INTEGER tag for S
-    der_signature.append(len(s_bytes))  # Length of S
-    der_signature.extend(s_bytes)  # S value
+    @cached_property
+    def public_key_xonly(self):
+        return coincurve.PublicKeyXOnly.from_valid_secret(self.secret, self.context)
 
-    return bytes(der_signature)
+    @classmethod
+    def from_int(cls, num, context=GLOBAL_CONTEXT):
+        return cls(int_to_bytes_padded(num), context)
+
+
+def _coincurve_internals_work():
+    # _CoincurvePrivateKey relies on coincurve internals that are not part of
+    # its public API, so check it against coincurve.PrivateKey once.
+    try:
+        secret = bytes(31) + b"\x01"
+        key = _CoincurvePrivateKey(secret)
+        reference = coincurve.PrivateKey(secret)
+        return (
+            key.to_int() == reference.to_int()
+            and key.public_key.format() == reference.public_key.format()
+            and key.sign(secret) == reference.sign(secret)
+        )
+    except Exception:  # pragma: no cover
+        return False
+
+
+_PrivateKeyClass = (
+    _CoincurvePrivateKey if _coincurve_internals_work() else coincurve.PrivateKey
+)
 
 
 class PrivateKey:
@@ -132,7 +178,7 @@ class PrivateKey:
         if len(b) < 32:
             raise ValueError("b must contain at least 32 bytes")
 
-        ckey = coincurve.PrivateKey(b)
+        ckey = _PrivateKeyClass(b)
         return PrivateKey(ckey, network)
 
     @staticmethod
@@ -162,7 +208,7 @@ class PrivateKey:
         Returns:
             PrivateKey: The object representing the private key.
         """
-        ckey = coincurve.PrivateKey.from_int(i)
+        ckey = _PrivateKeyClass.from_int(i)
         return PrivateKey(ckey, network)
 
     @staticmethod
@@ -261,11 +307,14 @@ class PrivateKey:
 
     def __init__(self, ckey, network=BitcoinSegwitMainNet):
         self._key = ckey
-        self._public_key = PublicKey(
-            coincurve.PublicKey.from_secret(binascii.unhexlify(ckey.to_hex())),
-            network=network,
-        )
+        # coincurve has already computed k*G (with libsecp256k1's precomputed
+        # generator table) when the private key was constructed, so reuse it.
+        self._public_key = PublicKey(ckey.public_key, network=network)
         self._network = network
+        # The WIF prefix never changes for a key, so build it only once.
+        self._wif_prefix = (
+            None if network.SECRET_KEY is None else bytes([network.SECRET_KEY])
+        )
 
     @property
     def network(self):
@@ -364,12 +413,13 @@ class PrivateKey:
 
         sig = base64.b64encode(self._key.sign(message)).decode()
         address = self._public_key.base58_address()
-        rfc2440 = f"-----BEGIN {self.network.NAME.upper()} SIGNED MESSAGE-----\n"
+        name = self.network.NAME.upper()
+        rfc2440 = f"-----BEGIN {name} SIGNED MESSAGE-----\n"
         rfc2440 += message.decode("utf-8") + "\n"
-        rfc2440 += f"-----BEGIN {self.network.NAME.upper()} SIGNATURE-----\n"
+        rfc2440 += f"-----BEGIN {name} SIGNATURE-----\n"
         rfc2440 += address + "\n"
         rfc2440 += sig + "\n"
-        rfc2440 += f"-----END {self.network.NAME.upper()} SIGNATURE-----\n"
+        rfc2440 += f"-----END {name} SIGNATURE-----\n"
         return rfc2440
 
     def rsz_sign(self, message):
@@ -393,12 +443,12 @@ class PrivateKey:
         if isinstance(message, str):
             message = bytes(message, "utf-8")
 
-        der = self._key.sign(message)
         z = sha256(message).digest()
+        der = self._key.sign(z, hasher=None)
         r, s = decode_der_signature(der)
-        r = int(binascii.hexlify(r), 16)
-        s = int(binascii.hexlify(s), 16)
-        z = int(binascii.hexlify(z), 16)
+        r = int.from_bytes(r, byteorder="big")
+        s = int.from_bytes(s, byteorder="big")
+        z = int.from_bytes(z, byteorder="big")
         return r, s, z
 
     def to_wif(self, compressed=False):
@@ -421,9 +471,8 @@ class PrivateKey:
             raise TypeError("Key network does not support Base58")
 
         # Add the network byte, creating the "extended key"
-        extended_key_hex = self.get_extended_key(self.network)
+        extended_key_bytes = self._extended_key_bytes(self.network)
         # BIP32 wallets have a trailing \01 byte
-        extended_key_bytes = binascii.unhexlify(extended_key_hex)
         if compressed:
             extended_key_bytes += b"\01"
         # And return the base58-encoded result with a checksum
@@ -439,11 +488,16 @@ class PrivateKey:
         Extended keys contain the network bytes and the public or private
         key.
         """
-        network_hex_chars = binascii.hexlify(bytes([network.SECRET_KEY]))
-        return network_hex_chars + self.to_hex().encode("utf-8")
+        return self._extended_key_bytes(network).hex().encode("utf-8")
+
+    def _extended_key_bytes(self, network):
+        # Network byte followed by the raw 32-byte secret
+        if network is self._network:
+            return self._wif_prefix + bytes(self)
+        return bytes([network.SECRET_KEY]) + bytes(self)
 
     def __bytes__(self):
-        return binascii.unhexlify(self._key.to_hex())
+        return self._key.secret
 
     def __int__(self):
         return self._key.to_int()
@@ -562,7 +616,7 @@ class PublicKey:
 
         if isinstance(message, str):
             message = message.encode("utf-8")
-        return coincurve.verify_signature(signature, message, bytes(self))
+        return self._key.verify(signature, message)
 
     def base64_verify(self, message, signature, address):
         """Verifies a signed message in Base64 format.
@@ -586,7 +640,7 @@ class PublicKey:
         if isinstance(message, str):
             message = message.encode("utf-8")
         signature = base64.b64decode(signature)
-        return coincurve.verify_signature(signature, message, bytes(self))
+        return self._key.verify(signature, message)
 
     def rfc2440_verify(self, text):
         """Verifies a signed message in the RFC2440 format.
@@ -601,14 +655,12 @@ class PublicKey:
         if self.hashonly:
             raise PublicKeyHashException
         text_lines = text.strip().split("\n")
-        if (
-            text_lines[0]
-            != f"-----BEGIN {self.network.NAME.upper()} SIGNED MESSAGE-----"
-        ):
+        name = self.network.NAME.upper()
+        if text_lines[0] != f"-----BEGIN {name} SIGNED MESSAGE-----":
             raise ValueError("Invalid RFC2440 signature")
-        elif text_lines[-4] != f"-----BEGIN {self.network.NAME.upper()} SIGNATURE-----":
+        elif text_lines[-4] != f"-----BEGIN {name} SIGNATURE-----":
             raise ValueError("Missing BEGIN in RFC2440 signature")
-        elif text_lines[-1] != f"-----END {self.network.NAME.upper()} SIGNATURE-----":
+        elif text_lines[-1] != f"-----END {name} SIGNATURE-----":
             raise ValueError("Missing END in RFC2440 signature")
 
         address = text_lines[-3].strip()
@@ -645,9 +697,9 @@ class PublicKey:
         ):
             return False
 
-        z = int.to_bytes(
-            z, length=((z.bit_length() + 7) // 8), byteorder="big", signed=False
-        )
+        if z.bit_length() > 256:
+            return False
+        z = z.to_bytes(32, byteorder="big")
 
         if isinstance(message, str):
             message = message.encode("utf-8")
@@ -656,33 +708,88 @@ class PublicKey:
             return False
 
         signature = encode_der_signature(r, s)
-        return coincurve.verify_signature(signature, message, bytes(self))
+        return self.digest_verify(z, signature)
+
+    def digest_verify(self, digest, signature):
+        """Verifies a DER signature over a message that is already hashed.
+
+        Use this when checking several signatures over the same message, so
+        that the message is only hashed once.
+
+        Args:
+            digest (bytes): The 32-byte SHA-256 digest of the message.
+            signature (bytes): A bytes DER signature.
+
+        Returns:
+            bool: True if the signature is authentic, False otherwise. A digest
+                that is not 32 bytes long never verifies.
+        """
+        if self.hashonly:
+            raise PublicKeyHashException
+        if len(digest) != 32:
+            return False
+        return self._key.verify(signature, digest, hasher=None)
 
     def __init__(self, ckey, network=BitcoinSegwitMainNet, hashonly=False):
         self._key = ckey
         self._network = network
+        # The address version byte never changes for a key, so build it only once.
+        self._addr_prefix = (
+            None if network.PUBKEY_ADDRESS is None else bytes([network.PUBKEY_ADDRESS])
+        )
+        # Rendered base58/bech32 addresses, keyed by their arguments.
+        self._addresses = {}
 
-        self.ripe = None
-        self.ripe_compressed = None
-        self.keccak = None
         self.hashonly = False
 
         if hashonly:
             # Only public key hash is available, disables a lot of functionality
             # Use ripe_compressed so that they work with default named args
+            self.ripe = None
             self.ripe_compressed = ckey
+            self.keccak = None
             self.hashonly = True
 
-        # Keccak-256 for Ethereum
-        if "HEX" in network.ADDRESS_MODE:
-            self.keccak = Keccak256(ckey.format(compressed=False)[1:]).digest()
-            return
+    # The serializations and hashes below are computed on first use and then
+    # cached, since rendering an address and the public key of the same key
+    # would otherwise serialize and hash it several times.
 
-        # RIPEMD-160 of SHA-256
-        self.ripe = ripemd160(hashlib.sha256(ckey.format(compressed=False)).digest())
-        self.ripe_compressed = ripemd160(
-            hashlib.sha256(ckey.format(compressed=True)).digest()
-        )
+    @cached_property
+    def _compressed_bytes(self):
+        return self._key.format(compressed=True)
+
+    @cached_property
+    def _uncompressed_bytes(self):
+        return self._key.format(compressed=False)
+
+    @cached_property
+    def ripe(self):
+        """RIPEMD-160 of SHA-256 of the uncompressed public key, or None on
+        networks that use hex addresses."""
+        if "HEX" in self._network.ADDRESS_MODE:
+            return None
+        return ripemd160(hashlib.sha256(self._uncompressed_bytes).digest())
+
+    @cached_property
+    def ripe_compressed(self):
+        """RIPEMD-160 of SHA-256 of the compressed public key, or None on
+        networks that use hex addresses."""
+        if "HEX" in self._network.ADDRESS_MODE:
+            return None
+        return ripemd160(hashlib.sha256(self._compressed_bytes).digest())
+
+    @cached_property
+    def keccak(self):
+        """Keccak-256 of the uncompressed public key (for Ethereum), or None on
+        networks that do not use hex addresses."""
+        if "HEX" not in self._network.ADDRESS_MODE:
+            return None
+        return keccak256(self._uncompressed_bytes[1:])
+
+    @cached_property
+    def _hex_address(self):
+        # The last 20 bytes of the Keccak-256 hash, as a 0x-prefixed hex string
+        return "0x" + self.keccak[12:].hex()
 
     @property
     def network(self):
@@ -699,7 +806,7 @@ class PublicKey:
         """
         if self.hashonly:
             raise PublicKeyHashException
-        return self._key.format(compressed)
+        return self._compressed_bytes if compressed else self._uncompressed_bytes
 
     def to_hex(self, compressed=True) -> str:
         """Converts the public key into a hex string.
@@ -711,7 +818,7 @@ class PublicKey:
         """
         if self.hashonly:
             raise PublicKeyHashException
-        return binascii.hexlify(self.to_bytes(compressed)).decode("utf-8")
+        return self.to_bytes(compressed).hex()
 
     def __bytes__(self):
         return self.to_bytes(compressed=True)
@@ -893,9 +1000,15 @@ class PublicKey:
                 self.network.NAME, "base58 addresses"
             )
 
-        # Put the version byte in front, 0x00 for Mainnet, 0x6F for testnet
-        version = bytes([self.network.PUBKEY_ADDRESS])
-        return b58encode_check(version + self.hash160(compressed)).decode("utf-8")
+        key = ("base58", compressed)
+        address = self._addresses.get(key)
+        if address is None:
+            # Put the version byte in front, 0x00 for Mainnet, 0x6F for testnet
+            address = b58encode_check(
+                self._addr_prefix + self.hash160(compressed)
+            ).decode("utf-8")
+            self._addresses[key] = address
+        return address
 
     def bech32_address(self, compressed=True, witness_version=0):
         """Address property that returns a bech32 encoding of the public key.
@@ -921,9 +1034,14 @@ class PublicKey:
 
         if not self.network.BECH32_PREFIX:
             raise ValueError("Network does not support Bech32")
-        return bech32_encode(
-            self.network.BECH32_PREFIX, witness_version, self.hash160(compressed)
-        )
+        key = ("bech32", compressed, witness_version)
+        address = self._addresses.get(key)
+        if address is None:
+            address = bech32_encode(
+                self.network.BECH32_PREFIX, witness_version, self.hash160(compressed)
+            )
+            self._addresses[key] = address
+        return address
 
     def hex_address(self):
         """Address property that returns a hexadecimal encoding of the public key."""
@@ -935,7 +1053,7 @@ class PublicKey:
                 self.network.NAME, "hexadecimal addresses"
             )
 
-        return "0x" + binascii.hexlify(self.keccak[12:]).decode("ascii")
+        return self._hex_address
 
     def address(self, compressed=True, witness_version=0):
         """Returns the address genereated according to the first supported address format by the network."""
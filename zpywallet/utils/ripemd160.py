@@ -39,15 +39,41 @@
 #  * ftp://ftp.rsasecurity.com/pub/cryptobytes/crypto3n2.pdf
 #  */
 
+import hashlib
 import sys
 import struct
 
+try:
+    hashlib.new("ripemd160")
+    _openssl_ripemd160 = True
+except ValueError:  # pragma: no cover
+    # OpenSSL 3 only ships RIPEMD160 in its legacy provider.
+    _openssl_ripemd160 = False
+
+try:
+    from Cryptodome.Hash import RIPEMD160 as _c_ripemd160
+except ImportError:  # pragma: no cover
+    _c_ripemd160 = None
+
 # -----------------------------------------------------------------------------
 # public interface
 
 
 def ripemd160(b: bytes) -> bytes:
-    """Calculates the RIPEMD160 hash of binary data"""
+    """Calculates the RIPEMD160 hash of binary data.
+
+    OpenSSL's RIPEMD160 (through hashlib) is used when it is available,
+    then PyCryptodome's, and otherwise the pure Python implementation below.
+    """
+    if _openssl_ripemd160:
+        return hashlib.new("ripemd160", b).digest()
+    if _c_ripemd160 is not None:
+        return _c_ripemd160.new(b).digest()
+    return ripemd160_python(b)
+
+
+def ripemd160_python(b: bytes) -> bytes:
+    """Calculates the RIPEMD160 hash of binary data in pure Python"""
     ctx = RMDContext()
     rmd160_update(ctx, b, len(b))
     digest = rmd160_final(ctx)
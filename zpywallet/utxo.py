@@ -1,9 +1,70 @@
-from zpywallet.errors import PublicKeyHashException
-from zpywallet.utils.base58 import is_b58check
-from zpywallet.utils.keys import PublicKey
+from zpywallet.utils.base58 import is_b58check, b58decode_check
+from zpywallet.utils.bech32 import bech32_decode
 from .transaction import Transaction
 
 
+def _address_hash(address, network):
+    # The public key hash (or witness program) is the payload of the address
+    # itself, so decode it directly instead of going through a hash-only
+    # PublicKey. Mirrors PublicKey.from_address().hash160().
+    try:
+        return b58decode_check(address)[1:]
+    except ValueError:
+        return bytes(bech32_decode(network.BECH32_PREFIX, address)[1])
+
+
+def _spent_outpoints(transactions):
+    # Every (txid, index) pair consumed by the inputs of the given transactions.
+    return frozenset(
+        (i["txid"], i["index"]) for t in transactions for i in t.sat_inputs()
+    )
+
+
+class _UTXOOutput:
+    """
+    The fields of a UTXO, kept in slots rather than a dict so that the
+    accessors of UTXO are plain attribute loads.
+
+    Item access is still supported for code that treats the output as a
+    mapping. Keys outside the fixed set are stored in the instance dict.
+    """
+
+    __slots__ = (
+        "txid",
+        "index",
+        "amount",
+        "address",
+        "spent",
+        "height",
+        "private_key",
+        "address_hash",
+        "nsequence",
+        "__dict__",
+    )
+
+    def __init__(self, fields):
+        self.txid = None
+        self.index = None
+        self.amount = None
+        self.address = None
+        self.spent = None
+        self.height = None
+        self.private_key = None
+        self.address_hash = None
+        self.nsequence = None
+        for key, value in fields.items():
+            setattr(self, key, value)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+
 class UTXO:
     """
     Represents an Unspent Transaction Output (UTXO) associated with a transaction.
@@ -21,6 +82,7 @@ class UTXO:
         only_mine=False,
         _internal_param_do_not_use=None,
         _network=None,
+        _spent=None,
     ):
         """
         Initializes a UTXO object.
@@ -38,38 +100,82 @@ class UTXO:
         if addresses is None:
             addresses = []
         if _internal_param_do_not_use:
-            self._output = _internal_param_do_not_use
-            self.network = _network
+            self._output = _UTXOOutput(_internal_param_do_not_use)
+            self._network = _network
             return
 
-        if transaction.network().SUPPORTS_EVM:
+        network = transaction.network()
+        if network.SUPPORTS_EVM:
             raise ValueError("Blockchain does not support UTXOs")
 
-        self._network = transaction.network()
+        self._network = network
         outputs = transaction.sat_outputs(only_unspent=True)
         try:
             output = outputs[index]
         except IndexError:
             raise IndexError(f"Transaction output {index} does not exist")
 
-        output["txid"] = transaction.txid()
-        output["height"] = transaction.height()
-        try:
-            output["address_hash"] = PublicKey.from_address(
-                output["address"], self._network
-            ).hash160()
-        except PublicKeyHashException:
-            output["address_hash"] = None
-
-        for ot in other_transactions:
-            for i in ot.sat_inputs():
-                if i["txid"] == transaction.txid() and i["index"] == index:
-                    raise ValueError("UTXO has already been spent")
-
+        # Reject outputs of other wallets before doing any decoding work
         if only_mine and output["address"] not in addresses:
             raise ValueError("UTXO does not belong to this wallet")
 
-        self._output = output
+        txid = transaction.txid()
+        if _spent is None:
+            _spent = _spent_outpoints(other_transactions)
+        if (txid, index) in _spent:
+            raise ValueError("UTXO has already been spent")
+
+        self._output = _UTXOOutput(output)
+        self._output.txid = txid
+        self._output.height = transaction.height()
+        self._output.address_hash = _address_hash(output["address"], network)
+
+    @classmethod
+    def build(
+        cls,
+        transactions,
+        other_transactions=None,
+        addresses=None,
+        only_mine=False,
+        only_unspent=False,
+    ):
+        """
+        Creates the UTXOs of several transactions at once.
+
+        The outputs spent by other_transactions are collected a single time
+        instead of once per output. Outputs that are spent or, with only_mine,
+        do not belong to the addresses are skipped.
+
+        Args:
+            transactions (list): The transactions to take the outputs from.
+            other_transactions (list, optional): Transactions whose inputs may spend the outputs. Defaults to None.
+            addresses (list, optional): Addresses associated with the UTXOs. Defaults to None.
+            only_mine (bool, optional): If True, only includes UTXOs belonging to the specified addresses.
+                Defaults to False.
+            only_unspent (bool, optional): Passed to Transaction.sat_outputs() to count the outputs
+                of each transaction. Defaults to False.
+
+        Returns:
+            List[UTXO]: The UTXOs of the transactions.
+        """
+        spent = _spent_outpoints(other_transactions or [])
+        addresses = frozenset(addresses or [])
+        utxos = []
+        for t in transactions:
+            for i in range(len(t.sat_outputs(only_unspent=only_unspent))):
+                try:
+                    utxos.append(
+                        cls(
+                            t,
+                            i,
+                            addresses=addresses,
+                            only_mine=only_mine,
+                            _spent=spent,
+                        )
+                    )
+                except ValueError:
+                    pass
+        return utxos
 
     def network(self):
         """
@@ -81,13 +187,13 @@ class UTXO:
         """
         Returns the transaction ID of the UTXO.
         """
-        return self._output["txid"]
+        return self._output.txid
 
     def index(self):
         """
         Returns the index of the UTXO.
         """
-        return self._output["index"]
+        return self._output.index
 
     def amount(self, in_standard_units=True):
         """
@@ -98,15 +204,15 @@ class UTXO:
                 If False, returns the amount in the lowest denomination. Defaults to True.
         """
         if in_standard_units:
-            return self._output["amount"] / 1e8
+            return self._output.amount / 1e8
         else:
-            return int(self._output["amount"])
+            return int(self._output.amount)
 
     def address(self):
         """
         Returns the address associated with the UTXO.
         """
-        return self._output["address"]
+        return self._output.address
 
     def is_legacy(self):
         """Returns whether this UTXO is for a legacy input."""
@@ -119,23 +225,23 @@ class UTXO:
         """
         Returns the block height of the UTXO.
         """
-        return self._output["height"]
+        return self._output.height
 
     # Private methods, do not use in user programs.
     def _private_key(self):
         """
         Returns the private key associated with the UTXO (for internal use only).
         """
-        return self._output["private_key"]
+        return self._output.private_key
 
     def _addresshash(self):
         """
         Returns the script pubkey associated with the UTXO (for internal use only).
         """
-        return self._output["address_hash"]
+        return self._output.address_hash
 
     def _nsequence(self):
         """
         Returns the sequence number associated with the UTXO (for internal use only).
         """
-        return self._output["nsequence"]
+        return self._output.nsequence
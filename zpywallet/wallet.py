@@ -51,10 +51,44 @@ from .address import CryptoClient
 
 from .nodes.eth import eth_nodes
 
-from .utils.aes import encrypt_str, decrypt_str
+from .utils.aes import encrypt_str, encrypt_str_many, decrypt_str
 
 from .transaction import Transaction
 
+# Protobuf enum of each network a wallet can be created for
+_NETWORK_ENUMS = {
+    BitcoinSegwitMainNet: wallet_pb2.BITCOIN_SEGWIT_MAINNET,
+    BitcoinMainNet: wallet_pb2.BITCOIN_MAINNET,
+    BitcoinSegwitTestNet: wallet_pb2.BITCOIN_SEGWIT_TESTNET,
+    BitcoinTestNet: wallet_pb2.BITCOIN_TESTNET,
+    LitecoinSegwitMainNet: wallet_pb2.LITECOIN_SEGWIT_MAINNET,
+    LitecoinMainNet: wallet_pb2.LITECOIN_MAINNET,
+    LitecoinBTCSegwitMainNet: wallet_pb2.LITECOIN_BTC_SEGWIT_MAINNET,
+    LitecoinBTCMainNet: wallet_pb2.LITECOIN_BTC_MAINNET,
+    LitecoinSegwitTestNet: wallet_pb2.LITECOIN_SEGWIT_TESTNET,
+    LitecoinTestNet: wallet_pb2.LITECOIN_TESTNET,
+    EthereumMainNet: wallet_pb2.ETHEREUM_MAINNET,
+    DogecoinMainNet: wallet_pb2.DOGECOIN_MAINNET,
+    DogecoinBTCMainNet: wallet_pb2.DOGECOIN_BTC_MAINNET,
+    DogecoinTestNet: wallet_pb2.DOGECOIN_TESTNET,
+    DashMainNet: wallet_pb2.DASH_MAINNET,
+    DashInvertedMainNet: wallet_pb2.DASH_INVERTED_MAINNET,
+    DashBTCMainNet: wallet_pb2.DASH_BTC_MAINNET,
+    DashTestNet: wallet_pb2.DASH_TESTNET,
+    DashInvertedTestNet: wallet_pb2.DASH_INVERTED_TESTNET,
+    BitcoinCashMainNet: wallet_pb2.BITCOIN_CASH_MAINNET,
+    BlockcypherTestNet: wallet_pb2.BLOCKCYPHER_TESTNET,
+}
+_ENUM_NETWORKS = {v: k for k, v in _NETWORK_ENUMS.items()}
+
+
+def _rpc_nodes(endpoints):
+    # Endpoints can be RPCNode messages or the dicts the address providers take
+    return [
+        e if isinstance(e, wallet_pb2.RPCNode) else wallet_pb2.RPCNode(**e)
+        for e in endpoints
+    ]
+
 
 def generate_mnemonic(strength=128):
     """Creates a new seed phrase of the specified length"""
@@ -121,6 +155,9 @@ def create_keypair(network=BitcoinSegwitMainNet):
 class Wallet:
     """Data class representing a cryptocurrency wallet."""
 
+    # Everything else about the wallet lives in the protobuf container
+    __slots__ = ("_network", "container", "encrypted_private_keys", "client")
+
     def __init__(
         self,
         network,
@@ -131,6 +168,8 @@ class Wallet:
         derivation_path=None,
         _with_wallet=True,
         max_cycles=100,
+        include_secrets=True,
+        hdwallet=None,
         **kwargs,
     ):
         """
@@ -144,12 +183,21 @@ class Wallet:
             change_gap_limit (int, optional): The maximum gap limit for change addresses. Defaults to 1000.
             derivation_path (str, optional): The derivation path for the wallet. Defaults to None.
             max_cycles (int, optional): The maximum number of cycles. Defaults to 100.
+            include_secrets (bool, optional): Whether to derive and encrypt the private
+                keys right away. If False, the addresses are derived from the public
+                key alone, and the private keys are derived from the seed phrase when
+                private_keys() is called. Defaults to True.
+            hdwallet (HDWallet, optional): The master key of the seed phrase, as returned
+                by HDWallet.from_mnemonic() without a passphrase. Passing it saves
+                stretching the seed phrase again. If seed_phrase is None, the seed
+                phrase of the master key is used. Defaults to None.
             fullnode_endpoints (list, optional): List of full node endpoints. Defaults to None.
             esplora_endpoints (list, optional): List of Esplora endpoints. Defaults to None.
             blockcypher_tokens (list, optional): List of Blockcypher tokens. Defaults to None.
 
         Raises:
-            ValueError: If an unknown network is provided or if the derivation path is invalid.
+            ValueError: If an unknown network is provided, if the derivation path is invalid,
+                or if hdwallet is not the master key of the seed phrase.
         """
 
         fullnode_endpoints = kwargs.get("fullnode_endpoints")
@@ -161,6 +209,18 @@ class Wallet:
             network.BIP32_SEGWIT_PATH or network.BIP32_PATH
         )
 
+        if hdwallet is not None:
+            seed_phrase = seed_phrase or hdwallet.mnemonic
+            if (
+                not seed_phrase
+                or hdwallet.has_passphrase
+                or hdwallet.depth != 0
+                or hdwallet.network is not network
+                or hdwallet.mnemonic != seed_phrase
+            ):
+                raise ValueError(
+                    "The HDWallet is not the master key of this seed phrase"
+                )
         seed_phrase = seed_phrase or generate_mnemonic()
 
         if not _with_wallet:
@@ -177,65 +237,63 @@ class Wallet:
             raise ValueError("Invalid derivation path")
 
         # Generate addresses and keys
-        hdwallet = HDWallet.from_mnemonic(mnemonic=seed_phrase, network=network)
-
-        # We do not save the password. Instead, we are going to
-        # generate a base64-encrypted serialization of this wallet file
-        # using the password.
-        self.container.encrypted_seed_phrase = encrypt_str(
-            seed_phrase, password
-        )  # AES-256-SIV encryption
+        if hdwallet is None:
+            hdwallet = HDWallet.from_mnemonic(mnemonic=seed_phrase, network=network)
 
         # Set properties
-        network_map = {
-            BitcoinSegwitMainNet: wallet_pb2.BITCOIN_SEGWIT_MAINNET,
-            BitcoinMainNet: wallet_pb2.BITCOIN_MAINNET,
-            BitcoinSegwitTestNet: wallet_pb2.BITCOIN_SEGWIT_TESTNET,
-            BitcoinTestNet: wallet_pb2.BITCOIN_TESTNET,
-            LitecoinSegwitMainNet: wallet_pb2.LITECOIN_SEGWIT_MAINNET,
-            LitecoinMainNet: wallet_pb2.LITECOIN_MAINNET,
-            LitecoinBTCSegwitMainNet: wallet_pb2.LITECOIN_BTC_SEGWIT_MAINNET,
-            LitecoinBTCMainNet: wallet_pb2.LITECOIN_BTC_MAINNET,
-            LitecoinSegwitTestNet: wallet_pb2.LITECOIN_SEGWIT_TESTNET,
-            LitecoinTestNet: wallet_pb2.LITECOIN_TESTNET,
-            EthereumMainNet: wallet_pb2.ETHEREUM_MAINNET,
-            DogecoinMainNet: wallet_pb2.DOGECOIN_MAINNET,
-            DogecoinBTCMainNet: wallet_pb2.DOGECOIN_BTC_MAINNET,
-            DogecoinTestNet: wallet_pb2.DOGECOIN_TESTNET,
-            DashMainNet: wallet_pb2.DASH_MAINNET,
-            DashInvertedMainNet: wallet_pb2.DASH_INVERTED_MAINNET,
-            DashBTCMainNet: wallet_pb2.DASH_BTC_MAINNET,
-            DashTestNet: wallet_pb2.DASH_TESTNET,
-            DashInvertedTestNet: wallet_pb2.DASH_INVERTED_TESTNET,
-            BitcoinCashMainNet: wallet_pb2.BITCOIN_CASH_MAINNET,
-            BlockcypherTestNet: wallet_pb2.BLOCKCYPHER_TESTNET,
-        }
-
-        self.container.network = network_map.get(network)
-        if self.container.network is None:
+        network_enum = _NETWORK_ENUMS.get(network)
+        if network_enum is None:
             raise ValueError("Unknown network")
-
-        self.container.fullnode_endpoints.extend(fullnode_endpoints or [])
-        self.container.esplora_endpoints.extend(esplora_endpoints or [])
-        self.container.blockcypher_tokens.extend(blockcypher_tokens or [])
+        self.container.network = network_enum
+
+        if fullnode_endpoints:
+            self.container.fullnode_endpoints.extend(_rpc_nodes(fullnode_endpoints))
+        if esplora_endpoints:
+            self.container.esplora_endpoints.extend(_rpc_nodes(esplora_endpoints))
+        if blockcypher_tokens:
+            self.container.blockcypher_tokens.extend(blockcypher_tokens)
+
+        receive_branch = hdwallet.get_child_for_path(f"{derivation_path}/0")
+        # Bind the per-address calls outside of the loop
+        add_address = self.container.addresses.add
+        if not include_secrets:
+            # Watch-only: derive the addresses from the branch's public key
+            for child in receive_branch.public_copy().get_children(
+                range(0, receive_gap_limit)
+            ):
+                pubkey = child.public_key
+                address = add_address()
+                address.address = pubkey.address()
+                address.pubkey = pubkey.to_hex()
+
+            self.container.encrypted_seed_phrase = encrypt_str(seed_phrase, password)
+            self.encrypted_private_keys = None
+            self._setup_client(max_cycles=max_cycles)
+            return
 
         self.encrypted_private_keys = []
-        for i in range(0, receive_gap_limit):
-            privkey = hdwallet.get_child_for_path(
-                f"{derivation_path}/0/{i}"
-            ).private_key
+        add_private_key = self.encrypted_private_keys.append
+        supports_evm = network.SUPPORTS_EVM
+        for child in receive_branch.get_children(range(0, receive_gap_limit)):
+            privkey = child.private_key
             pubkey = privkey.public_key
 
             # Add an Address
-            address = self.container.addresses.add()
+            address = add_address()
             address.address = pubkey.address()
             address.pubkey = pubkey.to_hex()
-            self.encrypted_private_keys.append(
-                privkey.to_hex() if network.SUPPORTS_EVM else privkey.to_wif()
-            )
-        self.encrypted_private_keys = encrypt_str(
-            json.dumps(self.encrypted_private_keys), password
-        )
+            add_private_key(privkey.to_hex() if supports_evm else privkey.to_wif())
+
+        # We do not save the password. Instead, we are going to
+        # generate a base64-encrypted serialization of this wallet file
+        # using the password. Both are encrypted in one go so that the
+        # expensive key derivation only runs once.
+        (
+            self.container.encrypted_seed_phrase,
+            self.encrypted_private_keys,
+        ) = encrypt_str_many(
+            [seed_phrase, json.dumps(self.encrypted_private_keys)], password
+        )  # AES-256-SIV encryption
 
         self._setup_client(max_cycles=max_cycles)
 
@@ -253,67 +311,70 @@ class Wallet:
         Returns:
             Wallet: The deserialized Wallet object.
 
+        Raises:
+            ValueError: If an unknown network is encountered during deserialization.
+        """
+        self = cls.from_serialized(data, max_cycles=max_cycles)
+        seed_phrase = decrypt_str(self.container.encrypted_seed_phrase, password)
+        self.encrypted_private_keys = encrypt_str(
+            json.dumps(self._derive_private_keys(seed_phrase)), password
+        )
+
+        del seed_phrase
+        del password
+
+        return self
+
+    @classmethod
+    def from_serialized(cls, data: bytes, max_cycles=100):
+        """
+        Load a Wallet object from its byte representation without decrypting it.
+
+        This only parses the serialized wallet, so it is much faster than
+        deserialize(). The addresses, transactions, balance and UTXOs of the
+        wallet are available right away. The private keys are derived from
+        the encrypted seed phrase when private_keys() is first called with
+        the password.
+
+        Args:
+            cls: The class object.
+            data (bytes): The byte representation of the Wallet object.
+            max_cycles (int, optional): The maximum number of cycles. Defaults to 100.
+
+        Returns:
+            Wallet: The loaded Wallet object.
+
         Raises:
             ValueError: If an unknown network is encountered during deserialization.
         """
         wallet = wallet_pb2.Wallet()
         wallet.ParseFromString(data)
-        seed_phrase = decrypt_str(wallet.encrypted_seed_phrase, password)
-
-        network_map = {
-            wallet_pb2.BITCOIN_SEGWIT_MAINNET: BitcoinSegwitMainNet,
-            wallet_pb2.BITCOIN_MAINNET: BitcoinMainNet,
-            wallet_pb2.BITCOIN_SEGWIT_TESTNET: BitcoinSegwitTestNet,
-            wallet_pb2.BITCOIN_TESTNET: BitcoinTestNet,
-            wallet_pb2.LITECOIN_SEGWIT_MAINNET: LitecoinSegwitMainNet,
-            wallet_pb2.LITECOIN_MAINNET: LitecoinMainNet,
-            wallet_pb2.LITECOIN_BTC_SEGWIT_MAINNET: LitecoinBTCSegwitMainNet,
-            wallet_pb2.LITECOIN_BTC_MAINNET: LitecoinBTCMainNet,
-            wallet_pb2.LITECOIN_SEGWIT_TESTNET: LitecoinSegwitTestNet,
-            wallet_pb2.LITECOIN_TESTNET: LitecoinTestNet,
-            wallet_pb2.ETHEREUM_MAINNET: EthereumMainNet,
-            wallet_pb2.DOGECOIN_MAINNET: DogecoinMainNet,
-            wallet_pb2.DOGECOIN_BTC_MAINNET: DogecoinBTCMainNet,
-            wallet_pb2.DOGECOIN_TESTNET: DogecoinTestNet,
-            wallet_pb2.DASH_MAINNET: DashMainNet,
-            wallet_pb2.DASH_INVERTED_MAINNET: DashInvertedMainNet,
-            wallet_pb2.DASH_BTC_MAINNET: DashBTCMainNet,
-            wallet_pb2.DASH_TESTNET: DashTestNet,
-            wallet_pb2.DASH_INVERTED_TESTNET: DashInvertedTestNet,
-            wallet_pb2.BITCOIN_CASH_MAINNET: BitcoinCashMainNet,
-            wallet_pb2.BLOCKCYPHER_TESTNET: BlockcypherTestNet,
-        }
 
-        network = network_map.get(wallet.network)
+        network = _ENUM_NETWORKS.get(wallet.network)
         if network is None:
             raise ValueError("Unknown network")
 
-        self = cls(network, seed_phrase, password, _with_wallet=False)
+        self = cls.__new__(cls)
+        self._network = network
         self.container = wallet
-        hdwallet = HDWallet.from_mnemonic(mnemonic=seed_phrase, network=network)
-
-        self.encrypted_private_keys = []
-        for i in range(0, self.container.receive_gap_limit):
-            privkey = hdwallet.get_child_for_path(
-                f"{self.container.derivation_path}/0/{i}"
-            ).private_key
-            self.encrypted_private_keys.append(
-                privkey.to_hex() if network.SUPPORTS_EVM else privkey.to_wif()
-            )
-            pubkey = privkey.public_key
-
-            # Add an Address
-            address = self.container.addresses.add()
-            address.address = pubkey.address()
-            address.pubkey = pubkey.to_hex()
-        self.encrypted_private_keys = encrypt_str(
-            json.dumps(self.encrypted_private_keys), password
-        )
-
-        del seed_phrase
-        del password
-
+        self.encrypted_private_keys = None
         self._setup_client(max_cycles=max_cycles)
+        return self
+
+    def _derive_private_keys(self, seed_phrase):
+        # The addresses are part of the serialized container already, only
+        # the private keys have to be derived again.
+        hdwallet = HDWallet.from_mnemonic(mnemonic=seed_phrase, network=self._network)
+        receive_branch = hdwallet.get_child_for_path(
+            f"{self.container.derivation_path}/0"
+        )
+        supports_evm = self._network.SUPPORTS_EVM
+        return [
+            child.private_key.to_hex() if supports_evm else child.private_key.to_wif()
+            for child in receive_branch.get_children(
+                range(0, self.container.receive_gap_limit)
+            )
+        ]
 
     def network(self):
         """
@@ -413,51 +474,47 @@ class Wallet:
         addresses = [a.address for a in self.container.addresses]
 
         transactions = self.get_transaction_history()
-        utxo_set = []
-        for t in transactions:
-            for i in range(len(t.sat_outputs(only_unspent=only_unspent))):
-                try:
-                    utxo_set.append(
-                        UTXO(
-                            t,
-                            i,
-                            addresses=addresses,
-                            other_transactions=transactions,
-                            only_mine=True,
-                        )
-                    )
-                except ValueError:
-                    pass
-
-        return utxo_set
+        return UTXO.build(
+            transactions,
+            other_transactions=transactions,
+            addresses=addresses,
+            only_mine=True,
+            only_unspent=only_unspent,
+        )
 
     def _to_human_friendly_utxo(self, inputs, private_keys):
+        # Decode each private key and render its addresses only once, rather
+        # than once for every input. The first key owning an address wins.
+        keys_by_address = {}
+        for private_key in private_keys:
+            if isinstance(private_key, bytes):
+                private_key = private_key.decode()
+            privkey = PrivateKey.from_wif(private_key, self._network)
+            try:
+                a = [
+                    privkey.public_key.base58_address(True),
+                    privkey.public_key.base58_address(False),
+                    privkey.public_key.bech32_address(),
+                ]
+            except Exception:
+                a = [
+                    privkey.public_key.base58_address(True),
+                    privkey.public_key.base58_address(False),
+                ]
+            for address in a:
+                keys_by_address.setdefault(address, privkey)
+            del private_key
+        if not keys_by_address:
+            return []
+
         new_inputs = []
-        for ii in range(len(inputs)):
-            u = inputs[ii]
-            for i in range(len(private_keys)):
-                private_key = private_keys[i]
-                privkey = PrivateKey.from_wif(private_key.decode(), self._network)
-                try:
-                    a = [
-                        privkey.public_key.base58_address(True),
-                        privkey.public_key.base58_address(False),
-                        privkey.public_key.bech32_address(),
-                    ]
-                except Exception:
-                    a = [
-                        privkey.public_key.base58_address(True),
-                        privkey.public_key.base58_address(False),
-                    ]
-                u._output["private_key"] = (
-                    privkey if u._output["address"] in a else None
-                )
-                u._output["address_hash"] = privkey.public_key.hash160()
-                del private_key
-                if u._output["private_key"] is None:
-                    continue
-                new_inputs.append(u)
-                break
+        for u in inputs:
+            privkey = keys_by_address.get(u._output.address)
+            if privkey is None:
+                continue
+            u._output.private_key = privkey
+            u._output.address_hash = privkey.public_key.hash160()
+            new_inputs.append(u)
         return new_inputs
 
     def get_balance(self, in_standard_units=True):
@@ -483,17 +540,15 @@ class Wallet:
 
         # Not an EVM chain
 
-        total_balance = 0
-        confirmed_balance = 0
-
-        utxos = self.get_utxos(only_unspent=True)
-        for u in utxos:
-            confirmed_balance += u.amount(in_standard_units=in_standard_units)
-
-        utxos = self.get_utxos()
-        for u in utxos:
-            total_balance += u.amount(in_standard_units=in_standard_units)
+        # Sum in the lowest denomination and convert once at the end, so that
+        # float rounding does not accumulate over many UTXOs.
+        confirmed_balance = sum(
+            u.amount(in_standard_units=False) for u in self.get_utxos(only_unspent=True)
+        )
+        total_balance = sum(u.amount(in_standard_units=False) for u in self.get_utxos())
 
+        if in_standard_units:
+            return total_balance / 1e8, confirmed_balance / 1e8
         return total_balance, confirmed_balance
 
     def addresses(self):
@@ -511,14 +566,19 @@ class Wallet:
 
         Returns:
             str: A randomly selected address from the wallet.
+
+        Raises:
+            ValueError: If the wallet has no addresses.
         """
         addresses = self.addresses()
+        if not addresses:
+            raise ValueError("The wallet has no addresses")
 
         # Use a secure RNG to resist blockchain analysis
         limit = len(addresses)
 
         # Convert bits to bytes and round up to the nearest byte
-        watermark = int(math.ceil(math.log2(len(addresses)))) // 8
+        watermark = ((len(addresses) - 1).bit_length() + 7) // 8
 
         while limit >= len(addresses):
             limit = int.from_bytes(Random.new().read(watermark), byteorder="big")
@@ -536,6 +596,12 @@ class Wallet:
         """
         private_keys = []
         try:
+            if self.encrypted_private_keys is None:
+                # Loaded with from_serialized(), derive them from the seed
+                private_keys = self._derive_private_keys(
+                    decrypt_str(self.container.encrypted_seed_phrase, password)
+                )
+                return private_keys
             private_keys = json.loads(
                 decrypt_str(self.encrypted_private_keys, password)
             )